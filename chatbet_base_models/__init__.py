@@ -103,10 +103,14 @@ from .promotion_config import (
     PromotionsConfigDB,
 )
 
+# DynamoDB helpers
+from ._common import iter_batch_write_requests
+
 # Tutorial
 from .tutorial import (
     TutorialItemDB,
     TutorialsDB,
+    TutorialsDBRead,
     TutorialVideo,
     GetTutorialVideosResponse,
     UploadTutorialVideoResponse,
@@ -196,9 +200,12 @@ __all__ = [
     "PromotionItem",
     "PromotionsConfig",
     "PromotionsConfigDB",
+    # DynamoDB helpers
+    "iter_batch_write_requests",
     # Tutorial
     "TutorialItemDB",
     "TutorialsDB",
+    "TutorialsDBRead",
     "TutorialVideo",
     "GetTutorialVideosResponse",
     "UploadTutorialVideoResponse",
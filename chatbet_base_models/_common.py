@@ -0,0 +1,203 @@
+"""
+Shared helpers for the DynamoDB-backed models.
+
+Private module: the public surface is re-exported from the package root.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel, HttpUrl
+
+Handler = Callable[[Any], Any]
+
+
+# ===========================
+# Timestamps
+# ===========================
+def utcnow() -> datetime:
+    """Timezone-aware UTC now, shared by every ``created_at``/``updated_at``
+    default factory."""
+    return datetime.now(timezone.utc)
+
+
+# ===========================
+# DynamoDB keys
+# ===========================
+COMPANY_PK_PREFIX = "company#"
+
+
+def company_pk(company_id: str) -> str:
+    """Partition key shared by every per-company config item."""
+    return COMPANY_PK_PREFIX + company_id
+
+
+# ===========================
+# DynamoDB serialization
+# ===========================
+def _identity(x: Any) -> Any:
+    return x
+
+
+def _enum_value(x: Enum) -> Any:
+    return x.value
+
+
+# Per-annotation field handlers; None means the value is stored as-is
+_FIELD_HANDLERS: Dict[Any, Optional[Handler]] = {
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    Decimal: None,
+    datetime: datetime.isoformat,
+}
+
+
+def _make_serializer(*, drop_none: bool) -> Handler:
+    """Build a serializer that turns models (or ``model_dump()`` output)
+    into a DynamoDB-friendly structure in a single pass.
+
+    - datetime -> ISO 8601
+    - HttpUrl  -> str
+    - Enum     -> value
+    - Decimal  -> kept as-is
+    - model    -> dict of its fields, read straight from the instance
+    - tuple    -> list
+    - dict     -> keys with ``None`` values are dropped when ``drop_none``
+
+    Dispatch is keyed on ``type(x)``; types not registered up-front are
+    resolved once through ``issubclass`` and memoized in the table. Each
+    model class gets its own handler with the field names captured once;
+    fields annotated exactly as a primitive or ``datetime`` skip the
+    dispatch table when the stored value has that exact type.
+    """
+
+    def ser_dict(x: dict) -> dict:
+        if not drop_none:
+            return {k: ser(v) for k, v in x.items()}
+        out = {}
+        for k, v in x.items():
+            v = ser(v)
+            if v is not None:
+                out[k] = v
+        return out
+
+    def ser_list(x: list) -> list:
+        return [ser(v) for v in x]
+
+    def model_serializer(tp: type) -> Handler:
+        # (name, exact annotated type or None, handler for that type). The
+        # shortcut only applies when the value really has that type:
+        # assignment and model_construct() skip validation.
+        fields = tuple(
+            (name, info.annotation, _FIELD_HANDLERS[info.annotation])
+            if info.annotation in _FIELD_HANDLERS
+            else (name, None, None)
+            for name, info in tp.model_fields.items()
+        )
+
+        def ser_model(x: BaseModel) -> dict:
+            # Read fields straight off the instance: no intermediate model_dump()
+            values = x.__dict__
+            out = {}
+            for k, ann, handler in fields:
+                v = values[k]
+                if type(v) is not ann:
+                    v = ser(v)
+                elif handler is not None:
+                    v = handler(v)
+                if not (drop_none and v is None):
+                    out[k] = v
+            return out
+
+        return ser_model
+
+    def resolve(tp: type) -> Handler:
+        if issubclass(tp, datetime):
+            return datetime.isoformat
+        if issubclass(tp, HttpUrl):
+            return str
+        if issubclass(tp, Enum):
+            return _enum_value
+        if issubclass(tp, dict):
+            return ser_dict
+        if issubclass(tp, (list, tuple)):
+            return ser_list
+        if issubclass(tp, BaseModel):
+            return model_serializer(tp)
+        return _identity  # primitivos
+
+    dispatch: Dict[type, Handler] = {
+        dict: ser_dict,
+        list: ser_list,
+        tuple: ser_list,
+        datetime: datetime.isoformat,
+        str: _identity,
+        int: _identity,
+        float: _identity,
+        bool: _identity,
+        type(None): _identity,
+        Decimal: _identity,
+    }
+
+    def ser(x: Any) -> Any:
+        handler = dispatch.get(type(x))
+        if handler is None:
+            handler = dispatch[type(x)] = resolve(type(x))
+        return handler(x)
+
+    return ser
+
+
+_SER_DROP_NONE = _make_serializer(drop_none=True)
+_SER_KEEP_NONE = _make_serializer(drop_none=False)
+
+
+def serialize_for_dynamodb(value: Any, *, drop_none: bool = True) -> Any:
+    """Serialize a model (or ``model_dump()`` tree) into DynamoDB-compatible
+    values."""
+    return (_SER_DROP_NONE if drop_none else _SER_KEEP_NONE)(value)
+
+
+# ===========================
+# DynamoDB batch writes
+# ===========================
+BATCH_WRITE_MAX_ITEMS = 25
+
+
+def iter_batch_write_requests(
+    items: Iterable[Any],
+    table_name: str,
+    *,
+    chunk: int = BATCH_WRITE_MAX_ITEMS,
+) -> Iterator[Dict[str, List[dict]]]:
+    """Group DB models into ``BatchWriteItem`` ``RequestItems`` payloads.
+
+    Each yielded dict holds up to ``chunk`` ``PutRequest`` entries for
+    ``table_name``, ready for ``dynamodb.batch_write_item(RequestItems=...)``
+    on the boto3 resource API. Models are serialized with their own
+    ``to_dynamodb_item()``; plain dicts are sent as-is.
+
+    DynamoDB may return part of a batch in ``UnprocessedItems``: callers
+    must resubmit those with exponential backoff.
+    """
+    if not 1 <= chunk <= BATCH_WRITE_MAX_ITEMS:
+        raise ValueError(
+            f"chunk must be between 1 and {BATCH_WRITE_MAX_ITEMS} (DynamoDB limit)"
+        )
+
+    batch: List[dict] = []
+    for item in items:
+        if hasattr(item, "to_dynamodb_item"):
+            item = item.to_dynamodb_item()
+        batch.append({"PutRequest": {"Item": item}})
+        if len(batch) == chunk:
+            yield {table_name: batch}
+            batch = []
+    if batch:
+        yield {table_name: batch}
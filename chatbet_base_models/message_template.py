@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 import re
-from typing import Dict, List, Literal, Optional, Any, Sequence, Set
-from enum import Enum
+from typing import Dict, List, Literal, Optional, Sequence, Set, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator, field_validator
+from pydantic_core import PydanticCustomError
+
+from ._common import company_pk, serialize_for_dynamodb, utcnow
 
 
 # ==================
@@ -477,6 +479,7 @@ class CombosMessages(BaseModel):
     @classmethod
     def model_validate(cls, obj):
         if isinstance(obj, dict):
+            obj = dict(obj)  # the fixes below must not leak into the caller's dict
             # Fix typos like errro_to_place_bet -> error_to_place_bet, sumary -> summary
             if "errro_to_place_bet" in obj and "error_to_place_bet" not in obj:
                 obj["error_to_place_bet"] = obj.pop("errro_to_place_bet")
@@ -576,6 +579,12 @@ DEFAULT_GENERAL_ERRORS: Dict[str, List[str]] = {
 }
 
 
+def _default_general_errors() -> Dict[str, List[str]]:
+    # Fresh lists per instance (no validation): edits to one ErrorMessages
+    # must not leak into DEFAULT_GENERAL_ERRORS or other instances
+    return {lang: list(msgs) for lang, msgs in DEFAULT_GENERAL_ERRORS.items()}
+
+
 class ErrorMessages(BaseModel):
     model_config = ConfigDict(extra="forbid")
     invalid_input: Optional[MessageItem] = None
@@ -584,7 +593,7 @@ class ErrorMessages(BaseModel):
     error_unavailable_bot: Optional[MessageItem] = None
     bet_error: Optional[MessageItem] = None
     general_errors: Dict[str, List[str]] = Field(
-        default_factory=lambda: DEFAULT_GENERAL_ERRORS
+        default_factory=_default_general_errors
     )
 
     @classmethod
@@ -592,8 +601,11 @@ class ErrorMessages(BaseModel):
         if isinstance(obj, dict):
             # Add default bet_error if not provided
             if "bet_error" not in obj or obj.get("bet_error") is None:
-                obj["bet_error"] = {
-                    "text": "Sorry, your bet was rejected, please try again later.",
+                obj = {
+                    **obj,
+                    "bet_error": {
+                        "text": "Sorry, your bet was rejected, please try again later.",
+                    },
                 }
             obj = cls._prepare_dict(obj)
         return super().model_validate(obj)
@@ -607,13 +619,18 @@ class ErrorMessages(BaseModel):
 
     @staticmethod
     def _prepare_dict(obj: dict) -> dict:
-        # Don't coerce general_errors as it's not a MessageItem
-        general_errors = obj.pop("general_errors", None)
-        obj = {k: MessageItem._coerce(v) for k, v in obj.items()}
+        # Don't coerce general_errors as it's not a MessageItem; the caller's
+        # dict (e.g. a DynamoDB item) is left untouched
+        general_errors = obj.get("general_errors")
+        out = {
+            k: MessageItem._coerce(v)
+            for k, v in obj.items()
+            if k != "general_errors"
+        }
         # Only assign if explicitly provided, otherwise default_factory handles it
         if general_errors is not None:
-            obj["general_errors"] = general_errors
-        return obj
+            out["general_errors"] = general_errors
+        return out
 
 
 class ConfirmationMessages(BaseModel):
@@ -826,13 +843,20 @@ class LinkItem(BaseModel):
         return cleaned
 
 
+# DEFAULT_LINKS validated once at import time
+DEFAULT_LINK_ITEMS: Tuple[LinkItem, ...] = tuple(
+    LinkItem(**link) for link in DEFAULT_LINKS
+)
+
+
 class LinksMessages(BaseModel):
     """Container for link items"""
 
     model_config = ConfigDict(extra="forbid")
 
     links: List[LinkItem] = Field(
-        default_factory=lambda: [LinkItem(**link) for link in DEFAULT_LINKS],
+        # LinkItem is mutable: hand out shallow copies, not the shared instances
+        default_factory=lambda: [link.model_copy() for link in DEFAULT_LINK_ITEMS],
         description="List of all link items (6 required defaults + optional additional links)",
     )
 
@@ -859,7 +883,8 @@ class LinksMessages(BaseModel):
         Additional links beyond the required 6 are allowed.
 
         Raises:
-            ValueError: If any required link titles are missing
+            PydanticCustomError: ``missing_required_links`` if any required
+                link titles are missing; ``ctx["missing"]`` lists them sorted
         """
         # Extract titles from current links (case-insensitive)
         current_titles_lower = {link.title.lower() for link in self.links}
@@ -869,11 +894,15 @@ class LinksMessages(BaseModel):
 
         if missing_titles:
             # Sort for consistent error messages
-            missing_sorted = sorted(missing_titles)
-            raise ValueError(
-                f"Missing required link titles: {missing_sorted}. "
-                f"Required links are: {sorted(REQUIRED_LINK_TITLES)}. "
-                f"You can modify their content but cannot delete them."
+            raise PydanticCustomError(
+                "missing_required_links",
+                "Missing required link titles: {missing}. "
+                "Required links are: {required}. "
+                "You can modify their content but cannot delete them.",
+                {
+                    "missing": sorted(missing_titles),
+                    "required": sorted(REQUIRED_LINK_TITLES),
+                },
             )
 
         return self
@@ -974,8 +1003,8 @@ class MessageTemplates(BaseModel):
     guidance: Optional[GuidanceMessages] = None
     links: LinksMessages = Field(default_factory=LinksMessages)
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     # ---------- Factory con defaults razonables ----------
     @classmethod
@@ -1383,7 +1412,6 @@ class MessageTemplates(BaseModel):
                 error_unavailable_bot=MessageItem(
                     text="Sorry, the bot is currently unavailable."
                 ),
-                general_errors=DEFAULT_GENERAL_ERRORS,
             ),
             confirmation=ConfirmationMessages(
                 confirm_bet=MessageItem(
@@ -1482,26 +1510,11 @@ class MessageTemplates(BaseModel):
 
     # ---------- utilidades ----------
     def touch(self) -> None:
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = utcnow()
 
     def to_dynamodb_item(self, *, drop_none: bool = True) -> dict:
         """Serializa a dict compatible con DynamoDB."""
-
-        def ser(x: Any) -> Any:
-            if isinstance(x, datetime):
-                return x.isoformat()
-            if isinstance(x, Enum):
-                return x.value
-            if hasattr(x, "model_dump"):
-                return ser(x.model_dump())
-            if isinstance(x, dict):
-                out = {k: ser(v) for k, v in x.items()}
-                return {k: v for k, v in out.items() if not (drop_none and v is None)}
-            if isinstance(x, list):
-                return [ser(v) for v in x]
-            return x  # primitivos
-
-        return ser(self.model_dump())
+        return serialize_for_dynamodb(self, drop_none=drop_none)
 
 
 # ==================
@@ -1513,12 +1526,21 @@ class MessageTemplatesDB(MessageTemplates):
 
     @classmethod
     def from_minimal(cls, company_id: str) -> "MessageTemplatesDB":
-        base = MessageTemplates.from_minimal()
-        return cls(
-            **base.model_dump(),
-            PK=f"company#{company_id}",
-            SK="message_templates",
-        )
+        return cls.attach_keys(MessageTemplates.from_minimal(), company_id)
+
+    @classmethod
+    def attach_keys(
+        cls, templates: MessageTemplates, company_id: str
+    ) -> "MessageTemplatesDB":
+        """Wrap already-validated templates with the company's PK/SK.
+
+        The nested sections are reused as-is (not re-validated nor copied),
+        so the result shares them with ``templates``.
+        """
+        fields = {
+            name: getattr(templates, name) for name in MessageTemplates.model_fields
+        }
+        return cls(**fields, PK=company_pk(company_id), SK="message_templates")
 
     @model_validator(mode="after")
     def _ensure_keys(self) -> "MessageTemplatesDB":
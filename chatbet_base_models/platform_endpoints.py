@@ -2,9 +2,21 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import Annotated, Dict, Optional, Any
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+
+from ._common import company_pk, serialize_for_dynamodb, utcnow
 
 
 # =========================
@@ -18,6 +30,36 @@ class HTTPMethod(str, Enum):
     DELETE = "DELETE"
 
 
+# Lookup directo (valor exacto o en minúscula) antes de normalizar el string
+_METHOD_LOOKUP: Dict[str, HTTPMethod] = {m.value: m for m in HTTPMethod}
+_METHOD_LOOKUP.update({m.value.lower(): m for m in HTTPMethod})
+
+
+# ===============
+# URL cacheada
+# ===============
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+
+@lru_cache(maxsize=4096)
+def _parse_http_url(raw: str) -> HttpUrl:
+    return _HTTP_URL_ADAPTER.validate_python(raw)
+
+
+def _cached_http_url(v: Any) -> Any:
+    # Las configs repiten pocas URLs distintas: parseamos cada string una vez.
+    # HttpUrl es inmutable, así que compartir la instancia es seguro.
+    if type(v) is str:
+        try:
+            return _parse_http_url(v)
+        except ValidationError:
+            return v  # dejamos que HttpUrl reporte el error habitual
+    return v
+
+
+EndpointUrl = Annotated[HttpUrl, BeforeValidator(_cached_http_url)]
+
+
 # ===============
 # Endpoint Model
 # ===============
@@ -26,7 +68,7 @@ class Endpoint(BaseModel):
 
     # method es opcional para permitir endpoints legacy sin método; si llega string libre lo normalizamos
     method: Optional[HTTPMethod] = None
-    endpoint: HttpUrl
+    endpoint: EndpointUrl
     params: Optional[Dict[str, str | bool | int | float]] = None
     payload: Optional[Dict[str, Any]] = None
     headers: Optional[Dict[str, Optional[str]]] = None
@@ -38,15 +80,13 @@ class Endpoint(BaseModel):
             return None
         if isinstance(v, HTTPMethod):
             return v
-        # normalizar string libre a Enum si coincide
-        s = str(v).strip().upper()
-        if s in HTTPMethod.__members__:
-            return HTTPMethod[s]
-        # también aceptar valores como "post", "get", etc
-        for m in HTTPMethod:
-            if s == m.value:
-                return m
-        raise ValueError(f"Invalid HTTP method: {v}")
+        method = _METHOD_LOOKUP.get(v) if type(v) is str else None
+        if method is None:
+            # normalizar string libre ("  post ", "Get", ...) a Enum si coincide
+            method = _METHOD_LOOKUP.get(str(v).strip().upper())
+        if method is None:
+            raise ValueError(f"Invalid HTTP method: {v}")
+        return method
 
 
 # ==========================
@@ -161,153 +201,150 @@ class APIEndpoints(BaseModel):
 
 
 # =========================================================
-# Versión DB con PK/SK + defaults y serialización DynamoDB
+# Defaults de placeholder (se construyen una sola vez)
 # =========================================================
-class APIEndpointsDB(APIEndpoints):
-    PK: Optional[str] = Field(default=None, description="Partition key")
-    SK: Optional[str] = Field(default=None, description="Sort key")
-    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
-
-    # --- DEFAULT FACTORY ---
-    @classmethod
-    def default_factory(cls, company_id: str) -> "APIEndpointsDB":
-        """
-        Crea una configuración por defecto con endpoints de placeholder.
-        No quedan campos NULL en DynamoDB: todas las hojas definen al menos url.
-        """
-        base_url = "https://placeholder.com/api"
-        ws_base = "wss://placeholder.com/ws"
-
-        def ep(url: str, method: HTTPMethod) -> Endpoint:
-            return Endpoint(
-                method=method,
-                endpoint=url,  # HttpUrl
-                params={},
-                payload={},
-                headers={},
-            )
+def _build_default_endpoints() -> APIEndpoints:
+    base_url = "https://placeholder.com/api"
+    ws_base = "wss://placeholder.com/ws"
+
+    def ep(url: str, method: HTTPMethod) -> Endpoint:
+        return Endpoint(
+            method=method,
+            endpoint=url,  # HttpUrl
+            params={},
+            payload={},
+            headers={},
+        )
 
-        defaults = APIEndpoints(
-            auth=AuthEndpoints(
-                validate_user=ep(f"{base_url}/auth/validate-user", HTTPMethod.POST),
-                validate_token=ep(f"{base_url}/auth/validate-token", HTTPMethod.POST),
-                generate_token=ep(f"{base_url}/auth/generate-token", HTTPMethod.POST),
+    return APIEndpoints(
+        auth=AuthEndpoints(
+            validate_user=ep(f"{base_url}/auth/validate-user", HTTPMethod.POST),
+            validate_token=ep(f"{base_url}/auth/validate-token", HTTPMethod.POST),
+            generate_token=ep(f"{base_url}/auth/generate-token", HTTPMethod.POST),
+        ),
+        users=UsersEndpoints(
+            get_user_balance=ep(f"{base_url}/users/get-balance", HTTPMethod.GET),
+        ),
+        sports=SportsEndpoints(
+            get_available_sports=ep(f"{base_url}/sports/available", HTTPMethod.GET),
+            list_sports=ep(f"{base_url}/sports/list", HTTPMethod.GET),
+            sports_priorities=ep(f"{base_url}/sports/priorities", HTTPMethod.GET),
+            update_sports_priorities=ep(
+                f"{base_url}/sports/priorities", HTTPMethod.PUT
             ),
-            users=UsersEndpoints(
-                get_user_balance=ep(f"{base_url}/users/get-balance", HTTPMethod.GET),
+        ),
+        tournaments=TournamentsEndpoints(
+            get_tournaments=ep(f"{base_url}/tournaments", HTTPMethod.GET),
+            get_sport_tournaments=ep(
+                f"{base_url}/sports/get/tournaments", HTTPMethod.GET
             ),
-            sports=SportsEndpoints(
-                get_available_sports=ep(f"{base_url}/sports/available", HTTPMethod.GET),
-                list_sports=ep(f"{base_url}/sports/list", HTTPMethod.GET),
-                sports_priorities=ep(f"{base_url}/sports/priorities", HTTPMethod.GET),
-                update_sports_priorities=ep(
-                    f"{base_url}/sports/priorities", HTTPMethod.PUT
-                ),
+            get_tournaments_priorities=ep(
+                f"{base_url}/tournaments/priorities", HTTPMethod.GET
             ),
-            tournaments=TournamentsEndpoints(
-                get_tournaments=ep(f"{base_url}/tournaments", HTTPMethod.GET),
-                get_sport_tournaments=ep(
-                    f"{base_url}/sports/get/tournaments", HTTPMethod.GET
-                ),
-                get_tournaments_priorities=ep(
-                    f"{base_url}/tournaments/priorities", HTTPMethod.GET
-                ),
-                update_tournaments_priorities=ep(
-                    f"{base_url}/tournaments/priorities", HTTPMethod.PUT
-                ),
+            update_tournaments_priorities=ep(
+                f"{base_url}/tournaments/priorities", HTTPMethod.PUT
             ),
-            markets=MarketsEndpoints(
-                markets_priorities=Endpoint(
-                    method=HTTPMethod.GET,
-                    endpoint=f"{base_url}/markets/priorities",
-                    params={"sport_id": "", "language": "es"},
-                    payload={},
-                    headers={},
-                ),
-                update_markets_priorities=ep(
-                    f"{base_url}/markets/priorities", HTTPMethod.PUT
-                ),
+        ),
+        markets=MarketsEndpoints(
+            markets_priorities=Endpoint(
+                method=HTTPMethod.GET,
+                endpoint=f"{base_url}/markets/priorities",
+                params={"sport_id": "", "language": "es"},
+                payload={},
+                headers={},
             ),
-            fixtures=FixturesEndpoints(
-                get_fixtures_by_sport=ep(
-                    f"{base_url}/fixtures/by-sport", HTTPMethod.GET
-                ),
-                get_fixtures_by_tournament=ep(
-                    f"{base_url}/fixtures/by-tournament", HTTPMethod.GET
-                ),
-                get_special_bets=ep(
-                    f"{base_url}/fixtures/special-bets", HTTPMethod.GET
-                ),
-                get_recommended_bets=ep(
-                    f"{base_url}/fixtures/recommended", HTTPMethod.GET
-                ),
-                get_recommended_fixtures=ep(
-                    f"{base_url}/fixtures/recommended-fixtures", HTTPMethod.GET
-                ),
-                search_fixtures=ep(f"{base_url}/fixtures/search", HTTPMethod.POST),
+            update_markets_priorities=ep(
+                f"{base_url}/markets/priorities", HTTPMethod.PUT
             ),
-            odds=OddsEndpoints(
-                get_fixture_odds=ep(f"{base_url}/odds/fixture", HTTPMethod.GET),
-                get_odds_combo=ep(f"{base_url}/odds/combo", HTTPMethod.POST),
+        ),
+        fixtures=FixturesEndpoints(
+            get_fixtures_by_sport=ep(
+                f"{base_url}/fixtures/by-sport", HTTPMethod.GET
             ),
-            bets=BetsEndpoints(
-                place_bet=ep(f"{base_url}/bets/place", HTTPMethod.POST),
+            get_fixtures_by_tournament=ep(
+                f"{base_url}/fixtures/by-tournament", HTTPMethod.GET
             ),
-            transactions=TransactionsEndpoints(
-                transactions=ep(f"{base_url}/transactions", HTTPMethod.POST),
+            get_special_bets=ep(
+                f"{base_url}/fixtures/special-bets", HTTPMethod.GET
             ),
-            combos=CombosEndpoints(
-                place_combo=ep(f"{base_url}/combos/place", HTTPMethod.POST),
-                get_combo_profit=ep(f"{base_url}/combos/profit", HTTPMethod.POST),
-                delete_bet_combo=ep(f"{base_url}/combos/bet", HTTPMethod.DELETE),
-                add_bet_to_combo=ep(f"{base_url}/combos/bet", HTTPMethod.POST),
-                get_odds_combo=ep(f"{base_url}/combos/odds", HTTPMethod.POST),
+            get_recommended_bets=ep(
+                f"{base_url}/fixtures/recommended", HTTPMethod.GET
             ),
-            sport_catalog=SportCatalogEndpoints(
-                get_sports=ep(f"{base_url}/catalog/sports", HTTPMethod.GET),
-                create_sports=ep(f"{base_url}/catalog/sports", HTTPMethod.POST),
-                update_sports=ep(f"{base_url}/catalog/sports", HTTPMethod.PUT),
-                get_regions=ep(f"{base_url}/catalog/regions", HTTPMethod.GET),
-                update_regions=ep(f"{base_url}/catalog/regions", HTTPMethod.PUT),
-                get_tournaments=ep(f"{base_url}/catalog/tournaments", HTTPMethod.GET),
-                update_tournaments=ep(
-                    f"{base_url}/catalog/tournaments", HTTPMethod.PUT
-                ),
-                get_markets=ep(f"{base_url}/catalog/markets", HTTPMethod.GET),
-                update_markets=ep(f"{base_url}/catalog/markets", HTTPMethod.PUT),
-                search_regions=ep(f"{base_url}/catalog/search/regions", HTTPMethod.GET),
-                search_tournaments=ep(
-                    f"{base_url}/catalog/search/tournaments", HTTPMethod.GET
-                ),
-                search_markets=ep(f"{base_url}/catalog/search/markets", HTTPMethod.GET),
+            get_recommended_fixtures=ep(
+                f"{base_url}/fixtures/recommended-fixtures", HTTPMethod.GET
             ),
-        )
+            search_fixtures=ep(f"{base_url}/fixtures/search", HTTPMethod.POST),
+        ),
+        odds=OddsEndpoints(
+            get_fixture_odds=ep(f"{base_url}/odds/fixture", HTTPMethod.GET),
+            get_odds_combo=ep(f"{base_url}/odds/combo", HTTPMethod.POST),
+        ),
+        bets=BetsEndpoints(
+            place_bet=ep(f"{base_url}/bets/place", HTTPMethod.POST),
+        ),
+        transactions=TransactionsEndpoints(
+            transactions=ep(f"{base_url}/transactions", HTTPMethod.POST),
+        ),
+        combos=CombosEndpoints(
+            place_combo=ep(f"{base_url}/combos/place", HTTPMethod.POST),
+            get_combo_profit=ep(f"{base_url}/combos/profit", HTTPMethod.POST),
+            delete_bet_combo=ep(f"{base_url}/combos/bet", HTTPMethod.DELETE),
+            add_bet_to_combo=ep(f"{base_url}/combos/bet", HTTPMethod.POST),
+            get_odds_combo=ep(f"{base_url}/combos/odds", HTTPMethod.POST),
+        ),
+        sport_catalog=SportCatalogEndpoints(
+            get_sports=ep(f"{base_url}/catalog/sports", HTTPMethod.GET),
+            create_sports=ep(f"{base_url}/catalog/sports", HTTPMethod.POST),
+            update_sports=ep(f"{base_url}/catalog/sports", HTTPMethod.PUT),
+            get_regions=ep(f"{base_url}/catalog/regions", HTTPMethod.GET),
+            update_regions=ep(f"{base_url}/catalog/regions", HTTPMethod.PUT),
+            get_tournaments=ep(f"{base_url}/catalog/tournaments", HTTPMethod.GET),
+            update_tournaments=ep(
+                f"{base_url}/catalog/tournaments", HTTPMethod.PUT
+            ),
+            get_markets=ep(f"{base_url}/catalog/markets", HTTPMethod.GET),
+            update_markets=ep(f"{base_url}/catalog/markets", HTTPMethod.PUT),
+            search_regions=ep(f"{base_url}/catalog/search/regions", HTTPMethod.GET),
+            search_tournaments=ep(
+                f"{base_url}/catalog/search/tournaments", HTTPMethod.GET
+            ),
+            search_markets=ep(f"{base_url}/catalog/search/markets", HTTPMethod.GET),
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_endpoints_dump() -> Dict[str, Any]:
+    """``model_dump()`` de los defaults, cacheado: cada ``default_factory``
+    re-valida este dict (instancias nuevas e independientes) en lugar de
+    reconstruir el árbol de ``Endpoint`` desde cero."""
+    return _build_default_endpoints().model_dump()
 
-        return cls(
-            **defaults.model_dump(),
-            PK=f"company#{company_id}",
-            SK="platform_endpoints",
+
+# =========================================================
+# Versión DB con PK/SK + defaults y serialización DynamoDB
+# =========================================================
+class APIEndpointsDB(APIEndpoints):
+    PK: Optional[str] = Field(default=None, description="Partition key")
+    SK: Optional[str] = Field(default=None, description="Sort key")
+    created_at: Optional[datetime] = Field(default_factory=utcnow)
+    updated_at: Optional[datetime] = Field(default_factory=utcnow)
+
+    # --- DEFAULT FACTORY ---
+    @classmethod
+    def default_factory(cls, company_id: str) -> "APIEndpointsDB":
+        """
+        Crea una configuración por defecto con endpoints de placeholder.
+        No quedan campos NULL en DynamoDB: todas las hojas definen al menos url.
+        """
+        return cls.model_validate(
+            {
+                **_default_endpoints_dump(),
+                "PK": company_pk(company_id),
+                "SK": "platform_endpoints",
+            }
         )
 
     # --- SERIALIZACIÓN DDB ---
     def to_dynamodb_item(self) -> dict:
-        from pydantic import HttpUrl
-        from enum import Enum
-
-        def serialize(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, HttpUrl):
-                return str(obj)
-            if isinstance(obj, Enum):
-                return obj.value
-            if hasattr(obj, "model_dump"):
-                return serialize(obj.model_dump())
-            if isinstance(obj, dict):
-                return {k: serialize(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [serialize(v) for v in obj]
-            return obj
-
-        return serialize(self.model_dump())
+        return serialize_for_dynamodb(self, drop_none=False)
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 from uuid import uuid4
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
+    TypeAdapter,
     field_validator,
     model_validator,
 )
+from typing_extensions import Self
+
+from ._common import company_pk, serialize_for_dynamodb, utcnow
 
 
 # ===========================
@@ -50,22 +55,11 @@ class PromotionItem(BaseModel):
         if len(v) > 20:
             raise ValueError("Maximum 20 keywords allowed")
 
-        cleaned = []
-        for keyword in v:
-            kw = keyword.strip().lower()
-            if not kw:
-                continue  # Skip empty keywords
-            if len(kw) > 50:
-                raise ValueError(f"Keyword too long (max 50 chars): {kw[:50]}...")
-            cleaned.append(kw)
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique = []
-        for kw in cleaned:
-            if kw not in seen:
-                seen.add(kw)
-                unique.append(kw)
+        # Normalize, skip empty keywords and remove duplicates (order preserved)
+        unique = list(dict.fromkeys(filter(None, (kw.strip().lower() for kw in v))))
+        if max(map(len, unique), default=0) > 50:
+            kw = next(kw for kw in unique if len(kw) > 50)
+            raise ValueError(f"Keyword too long (max 50 chars): {kw[:50]}...")
 
         return unique
 
@@ -85,6 +79,9 @@ class PromotionItem(BaseModel):
         return self
 
 
+_PROMOTION_LIST_ADAPTER = TypeAdapter(List[PromotionItem])
+
+
 # ===========================
 # Main Configuration - Array Container
 # ===========================
@@ -98,8 +95,8 @@ class PromotionsConfig(BaseModel):
         description="List of all promotions",
     )
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     # Array-level validation
     @field_validator("promotions")
@@ -108,11 +105,15 @@ class PromotionsConfig(BaseModel):
         """Validate promotions array"""
         if len(v) > 100:
             raise ValueError("Maximum 100 promotions allowed")
+        if not v:
+            return v
 
-        # Check for duplicate promotion_ids
-        ids = [p.promotion_id for p in v]
-        if len(ids) != len(set(ids)):
-            raise ValueError("Duplicate promotion_id found in promotions array")
+        # Check for duplicate promotion_ids, stopping at the first one
+        seen = set()
+        for p in v:
+            if p.promotion_id in seen:
+                raise ValueError("Duplicate promotion_id found in promotions array")
+            seen.add(p.promotion_id)
 
         return v
 
@@ -120,17 +121,68 @@ class PromotionsConfig(BaseModel):
     @classmethod
     def from_minimal(cls) -> "PromotionsConfig":
         """Create an empty promotions config"""
-        now = datetime.now(timezone.utc)
+        now = utcnow()
         return cls(
             promotions=[],
             created_at=now,
             updated_at=now,
         )
 
+    @classmethod
+    def from_dynamodb_item(cls, item: dict) -> "PromotionsConfig":
+        """Build a config from a stored DynamoDB item.
+
+        The promotions array is validated once through a module-level
+        TypeAdapter; the container then receives ready PromotionItem
+        instances, which Pydantic does not validate again.
+        """
+        data = dict(item)
+        data["promotions"] = _PROMOTION_LIST_ADAPTER.validate_python(
+            data.get("promotions") or []
+        )
+        return cls.model_validate(data)
+
+    # Lookup index: promotion_id -> position in promotions. Built on
+    # construction so equal configs compare equal (== includes private
+    # attributes), and kept in sync by the helpers below.
+    _id_index: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any) -> None:
+        self._reindex()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        """Copy the config; the copy gets its own id index"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._reindex()
+        return copied
+
+    def _reindex(self) -> None:
+        self._id_index = {p.promotion_id: i for i, p in enumerate(self.promotions)}
+
+    def _index_of(self, promotion_id: str) -> Optional[int]:
+        """Position of promotion_id, or None.
+
+        O(1) while the index is consistent. Direct edits to the list can
+        leave it stale: a size mismatch or a hit on the wrong item triggers
+        a rebuild.
+        """
+        promos = self.promotions
+        if len(self._id_index) != len(promos):
+            self._reindex()
+        i = self._id_index.get(promotion_id)
+        if i is not None and (
+            i >= len(promos) or promos[i].promotion_id != promotion_id
+        ):
+            self._reindex()
+            i = self._id_index.get(promotion_id)
+        return i
+
     # Utility methods
     def touch(self) -> None:
         """Update the updated_at timestamp"""
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = utcnow()
 
     def add_promotion(
         self,
@@ -142,7 +194,16 @@ class PromotionsConfig(BaseModel):
         keywords: Optional[List[str]] = None,
         promotion_id: Optional[str] = None,
     ) -> PromotionItem:
-        """Add a new promotion to the array"""
+        """Add a new promotion to the array.
+
+        Enforces the same limits as the array validator, checking only the
+        new item: the 100-promotion cap and promotion_id uniqueness.
+        """
+        if len(self.promotions) >= 100:
+            raise ValueError("Maximum 100 promotions allowed")
+        if promotion_id and self._index_of(promotion_id) is not None:
+            raise ValueError("Duplicate promotion_id found in promotions array")
+
         promotion = PromotionItem(
             promotion_id=promotion_id or str(uuid4()),
             title=title,
@@ -152,49 +213,49 @@ class PromotionsConfig(BaseModel):
             keywords=keywords or [],
         )
         self.promotions.append(promotion)
+        self._id_index[promotion.promotion_id] = len(self.promotions) - 1
         self.touch()
         return promotion
 
     def remove_promotion(self, promotion_id: str) -> bool:
         """Remove a promotion by ID. Returns True if found and removed."""
-        for i, promo in enumerate(self.promotions):
-            if promo.promotion_id == promotion_id:
-                self.promotions.pop(i)
-                self.touch()
-                return True
-        return False
+        i = self._index_of(promotion_id)
+        if i is None:
+            return False
+        promos = self.promotions
+        del promos[i]
+        # Keep order: only the positions after i shift
+        index = self._id_index
+        del index[promotion_id]
+        for j in range(i, len(promos)):
+            index[promos[j].promotion_id] = j
+        self.touch()
+        return True
+
+    def remove_promotions(self, promotion_ids: Iterable[str]) -> int:
+        """Remove promotions by ID in one pass, keeping order; returns the count."""
+        ids = set(promotion_ids)
+        kept = [promo for promo in self.promotions if promo.promotion_id not in ids]
+        removed = len(self.promotions) - len(kept)
+        if removed:
+            self.promotions[:] = kept
+            self._reindex()
+            self.touch()
+        return removed
 
     def get_promotion(self, promotion_id: str) -> Optional[PromotionItem]:
         """Get a promotion by ID"""
-        for promo in self.promotions:
-            if promo.promotion_id == promotion_id:
-                return promo
-        return None
+        i = self._index_of(promotion_id)
+        return None if i is None else self.promotions[i]
 
     def get_active_promotions(self) -> List[PromotionItem]:
         """Get all currently active promotions based on dates"""
-        now = datetime.now(timezone.utc)
+        now = utcnow()
         return [p for p in self.promotions if p.start_date <= now < p.end_date]
 
     def to_dynamodb_item(self, *, drop_none: bool = True) -> dict:
         """Serialize to DynamoDB-compatible dict"""
-        from enum import Enum
-
-        def ser(x: Any) -> Any:
-            if isinstance(x, datetime):
-                return x.isoformat()
-            if isinstance(x, Enum):
-                return x.value
-            if isinstance(x, dict):
-                out = {k: ser(v) for k, v in x.items()}
-                return {k: v for k, v in out.items() if not (drop_none and v is None)}
-            if isinstance(x, list):
-                return [ser(v) for v in x]
-            if hasattr(x, "model_dump"):
-                return ser(x.model_dump())
-            return x  # primitives
-
-        return ser(self.model_dump())
+        return serialize_for_dynamodb(self, drop_none=drop_none)
 
 
 # ===========================
@@ -209,17 +270,39 @@ class PromotionsConfigDB(PromotionsConfig):
     @classmethod
     def from_minimal(cls, company_id: str) -> "PromotionsConfigDB":
         """Create an empty promotions config for a company"""
-        base = PromotionsConfig.from_minimal()
-        return cls(
-            **base.model_dump(),
-            PK=f"company#{company_id}",
+        # Keys are set here, so the trusted base skips re-validation
+        # (including _ensure_keys).
+        return cls.model_construct(
+            **dict(PromotionsConfig.from_minimal()),
+            PK=company_pk(company_id),
             SK="promotions_config",
         )
 
+    @classmethod
+    def bulk_from_minimal(
+        cls, company_ids: Iterable[str]
+    ) -> List["PromotionsConfigDB"]:
+        """Create empty promotions configs for many companies at once.
+
+        Meant for tenant bootstrapping and migrations: every config shares a
+        single timestamp and is built without re-validation.
+        """
+        now = utcnow()
+        return [
+            cls.model_construct(
+                promotions=[],
+                created_at=now,
+                updated_at=now,
+                PK=company_pk(company_id),
+                SK="promotions_config",
+            )
+            for company_id in company_ids
+        ]
+
     @model_validator(mode="after")
     def _ensure_keys(self) -> "PromotionsConfigDB":
         """Ensure PK and SK are set"""
-        if not self.PK or not self.SK:
+        if not (self.PK and self.SK):
             raise ValueError("PK and SK are required for PromotionsConfigDB")
         return self
 
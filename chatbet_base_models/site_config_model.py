@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from enum import Enum
@@ -14,6 +15,15 @@ from pydantic import (
     model_validator,
 )
 
+from ._common import company_pk, serialize_for_dynamodb, utcnow
+
+# Compat con payloads que aún traen "whapi" en Integrations. Poner
+# ENABLE_LEGACY_WHAPI_COMPAT=0 cuando los documentos ya estén migrados.
+ENABLE_LEGACY_WHAPI_COMPAT = os.getenv("ENABLE_LEGACY_WHAPI_COMPAT", "1").lower() not in (
+    "0",
+    "false",
+)
+
 # ==========================="
 # Enums and basic types
 # ==========================="
@@ -64,12 +74,14 @@ class MoneyLimits(BaseModel):
     @field_validator("min_bet_amount", "max_bet_amount", mode="before")
     @classmethod
     def _to_decimal(cls, v):
-        if v is None:
-            return v
-        if isinstance(v, Decimal):
+        if v is None or isinstance(v, Decimal):
             return v
+        # int is exact; str parses directly. Anything else (float) still goes
+        # through str() so 1.1 becomes Decimal("1.1"), not its binary repr.
+        if type(v) is int:
+            return Decimal(v)
         try:
-            return Decimal(str(v))
+            return Decimal(v if isinstance(v, str) else str(v))
         except (InvalidOperation, ValueError) as e:
             raise ValueError(f"Invalid amount: {v}") from e
 
@@ -203,7 +215,10 @@ class Integrations(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def _map_legacy_whapi(cls, values: Any) -> Any:
-        if isinstance(values, dict) and "whapi" in values and "whatsapp" not in values:
+        # Camino moderno: un solo membership test
+        if not (isinstance(values, dict) and "whapi" in values):
+            return values
+        if ENABLE_LEGACY_WHAPI_COMPAT and "whatsapp" not in values:
             whapi_val = values.pop("whapi")
             # Aceptamos tanto forma simple como wrapper
             if whapi_val is None:
@@ -370,8 +385,8 @@ class FeaturesConfig(BaseModel):
 class Meta(BaseModel):
     model_config = ConfigDict(extra="forbid")
     schema_version: str = "1.0.0"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 
 # ==========================="
@@ -410,6 +425,12 @@ class AuthConfig(BaseModel):
 # ==========================="
 
 
+def _default_identity(site_name: str, company_id: str) -> Identity:
+    return Identity(
+        site_name=site_name, company_id=company_id, site_url="https://default.url"
+    )
+
+
 class SiteConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -526,37 +547,24 @@ class SiteConfig(BaseModel):
 
     @classmethod
     def default_factory(cls, site_name: str, company_id: str) -> SiteConfig:
-        identity = Identity(
-            site_name=site_name, company_id=company_id, site_url="https://default.url"
-        )
-        return cls(identity=identity)
+        return cls(identity=_default_identity(site_name, company_id))
 
 
 class SiteConfigDB(SiteConfig):
     PK: Optional[str] = Field(default=None, description="Partition key")
     SK: Optional[str] = Field(default=None, description="Sort key")
-    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default_factory=utcnow)
+    updated_at: Optional[datetime] = Field(default_factory=utcnow)
 
     @classmethod
     def default_factory(cls, site_name: str, company_id: str) -> SiteConfigDB:
-        base = SiteConfig.default_factory(site_name, company_id)
-        return cls(**base.model_dump(), PK=f"company#{company_id}", SK="site_config")
+        # Las secciones por defecto salen de los default_factory de los campos:
+        # sin pasar por SiteConfig + model_dump() + revalidar todo el árbol.
+        return cls(
+            identity=_default_identity(site_name, company_id),
+            PK=company_pk(company_id),
+            SK="site_config",
+        )
 
     def to_dynamodb_item(self) -> dict:
-        def serialize(obj: Any) -> Any:
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, HttpUrl):
-                return str(obj)
-            if isinstance(obj, Enum):
-                return obj.value
-            if hasattr(obj, "model_dump"):
-                return serialize(obj.model_dump())
-            if isinstance(obj, dict):
-                return {k: serialize(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [serialize(v) for v in obj]
-            return obj  # primitive types
-
-        return serialize(self.model_dump())
+        return serialize_for_dynamodb(self, drop_none=False)
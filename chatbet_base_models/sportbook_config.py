@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from enum import Enum
-from typing import Any, List, Optional, Union, Annotated, Literal
+from datetime import datetime
+from typing import List, Optional, Union, Annotated, Literal
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
     HttpUrl,
+    TypeAdapter,
     model_validator,
 )
 
+from ._common import company_pk, serialize_for_dynamodb, utcnow
+
 
 # ===========================
 # S3 Reference for Sports
@@ -182,6 +184,27 @@ class BetbyConfig(BaseModel):
     check_fixture_availability: Optional[bool] = False
 
 
+_PROVIDER_CONFIGS = (
+    Betsw3Config,
+    DigitainConfig,
+    PhoenixConfig,
+    KambiConfig,
+    PlannatechConfig,
+    IsolutionsConfig,
+    BetbyConfig,
+)
+
+# Etiqueta `sportbook` que usan los constructores para cada proveedor
+_SPORTBOOK_LABELS = {
+    Betsw3Config: "Betsw3",
+    DigitainConfig: "Digitain",
+    PhoenixConfig: "Phoenix",
+    KambiConfig: "Kambi",
+    PlannatechConfig: "Plannatech",
+    IsolutionsConfig: "Isolutions",
+    BetbyConfig: "Betby",
+}
+
 ConfigUnion = Annotated[
     Union[
         Betsw3Config,
@@ -207,6 +230,9 @@ class StakeType(BaseModel):
     order: int = Field(default=999_999)
 
 
+_TOURNAMENT_LIST_ADAPTER = TypeAdapter(List[Tournament])
+
+
 # ===========================
 # SportbookConfig (core)
 # ===========================
@@ -223,10 +249,32 @@ class SportbookConfig(BaseModel):
     sports: Optional[SportsS3Reference] = None
 
     # timestamps por consistencia con tu SiteConfigDB (opcionales aquí)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     # ---------- Constructores con defaults ----------
+    @classmethod
+    def _from_provider(
+        cls,
+        sportbook: str,
+        cfg: BaseModel,
+        tournaments: Optional[List[Tournament]],
+    ) -> "SportbookConfig":
+        # `cfg` ya es la clase concreta del proveedor: model_construct evita
+        # volver a resolver el discriminador de ConfigUnion.
+        now = utcnow()
+        return cls.model_construct(
+            sportbook=sportbook,
+            config=cfg,
+            tournaments=(
+                _TOURNAMENT_LIST_ADAPTER.validate_python(tournaments)
+                if tournaments
+                else _default_tournaments()
+            ),
+            created_at=now,
+            updated_at=now,
+        )
+
     @classmethod
     def from_minimal_phoenix(
         cls,
@@ -259,14 +307,7 @@ class SportbookConfig(BaseModel):
             integration_state=integration_state,
             check_fixture_availability=check_fixture_availability,
         )
-        now = datetime.now(timezone.utc)
-        return cls(
-            sportbook="Phoenix",
-            config=cfg,
-            tournaments=tournaments or _default_tournaments(),
-            created_at=now,
-            updated_at=now,
-        )
+        return cls._from_provider("Phoenix", cfg, tournaments)
 
     @classmethod
     def from_minimal_betsw3(
@@ -294,14 +335,7 @@ class SportbookConfig(BaseModel):
             url=url,
             check_fixture_availability=check_fixture_availability,
         )
-        now = datetime.now(timezone.utc)
-        return cls(
-            sportbook="Betsw3",
-            config=cfg,
-            tournaments=tournaments or _default_tournaments(),
-            created_at=now,
-            updated_at=now,
-        )
+        return cls._from_provider("Betsw3", cfg, tournaments)
 
     @classmethod
     def from_minimal_digitain(
@@ -330,14 +364,7 @@ class SportbookConfig(BaseModel):
             main_market_only=main_market_only,
             check_fixture_availability=check_fixture_availability,
         )
-        now = datetime.now(timezone.utc)
-        return cls(
-            sportbook="Digitain",
-            config=cfg,
-            tournaments=tournaments or _default_tournaments(),
-            created_at=now,
-            updated_at=now,
-        )
+        return cls._from_provider("Digitain", cfg, tournaments)
 
     @classmethod
     def from_minimal_kambi(
@@ -354,14 +381,7 @@ class SportbookConfig(BaseModel):
             operator_url=operator_url,
             check_fixture_availability=check_fixture_availability,
         )
-        now = datetime.now(timezone.utc)
-        return cls(
-            sportbook="Kambi",
-            config=cfg,
-            tournaments=_default_tournaments(),
-            created_at=now,
-            updated_at=now,
-        )
+        return cls._from_provider("Kambi", cfg, None)
 
     @classmethod
     def from_minimal_plannatech(
@@ -377,14 +397,7 @@ class SportbookConfig(BaseModel):
             grpc_url=grpc_url,
             check_fixture_availability=check_fixture_availability,
         )
-        now = datetime.now(timezone.utc)
-        return cls(
-            sportbook="Plannatech",
-            config=cfg,
-            tournaments=tournaments or _default_tournaments(),
-            created_at=now,
-            updated_at=now,
-        )
+        return cls._from_provider("Plannatech", cfg, tournaments)
 
     @classmethod
     def from_minimal_isolutions(
@@ -412,14 +425,7 @@ class SportbookConfig(BaseModel):
             check_fixture_availability=check_fixture_availability,
             last_server_date=last_server_date,
         )
-        now = datetime.now(timezone.utc)
-        return cls(
-            sportbook="Isolutions",
-            config=cfg,
-            tournaments=tournaments or _default_tournaments(),
-            created_at=now,
-            updated_at=now,
-        )
+        return cls._from_provider("Isolutions", cfg, tournaments)
 
     @classmethod
     def from_minimal_betby(
@@ -439,18 +445,84 @@ class SportbookConfig(BaseModel):
             private_key_ssm_param=private_key_ssm_param,
             check_fixture_availability=check_fixture_availability,
         )
-        now = datetime.now(timezone.utc)
-        return cls(
-            sportbook="Betby",
-            config=cfg,
-            tournaments=tournaments or _default_tournaments(),
-            created_at=now,
-            updated_at=now,
-        )
+        return cls._from_provider("Betby", cfg, tournaments)
 
     # ---------- utilidades ----------
     def touch(self) -> None:
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = utcnow()
+
+    def with_config(self, cfg: ConfigUnion) -> "SportbookConfig":
+        """Copia con otro config de proveedor (p.ej. update desde el admin).
+
+        `cfg` debe ser una instancia ya validada; no se re-valida ni se
+        resuelve de nuevo el discriminador. `sportbook` pasa a ser la etiqueta
+        del nuevo proveedor y los torneos se copian, para que la copia no
+        comparta listas con el original. PK/SK se conservan en la variante DB.
+        """
+        if not isinstance(cfg, _PROVIDER_CONFIGS):
+            raise TypeError(
+                f"cfg must be a provider config instance, got {type(cfg).__name__}"
+            )
+        tournaments = self.tournaments
+        if tournaments is not None:
+            tournaments = [t.model_copy(deep=True) for t in tournaments]
+        return self.model_copy(
+            update={
+                "sportbook": _SPORTBOOK_LABELS[type(cfg)],
+                "config": cfg,
+                "tournaments": tournaments,
+                "updated_at": utcnow(),
+            }
+        )
+
+    def to_columnar(self) -> dict:
+        """Vista columnar (SoA) del árbol de torneos para el path de lectura.
+
+        Cada nivel se aplana en listas paralelas; ``region_ranges`` y
+        ``competition_ranges`` son pares ``[inicio, fin)`` que apuntan al
+        nivel siguiente. Los ``stake_types`` no se incluyen. Es una vista
+        derivada para cachear/servir: las escrituras siguen usando el modelo.
+        """
+        t_ids, t_names, t_markets, t_orders, t_ranges = [], [], [], [], []
+        r_ids, r_names, r_orders, r_ranges = [], [], [], []
+        c_ids, c_names, c_orders = [], [], []
+
+        for t in self.tournaments or ():
+            t_ids.append(t.sport_id)
+            t_names.append(t.sport_name)
+            t_markets.append(t.main_market)
+            t_orders.append(t.order)
+            r_start = len(r_ids)
+            for r in t.regions:
+                r_ids.append(r.id)
+                r_names.append(r.name)
+                r_orders.append(r.order)
+                c_start = len(c_ids)
+                for c in r.competitions:
+                    c_ids.append(c.id)
+                    c_names.append(c.name)
+                    c_orders.append(c.order)
+                r_ranges.append([c_start, len(c_ids)])
+            t_ranges.append([r_start, len(r_ids)])
+
+        return {
+            "sport_ids": t_ids,
+            "sport_names": t_names,
+            "main_markets": t_markets,
+            "sport_orders": t_orders,
+            "region_ranges": t_ranges,
+            "regions": {
+                "ids": r_ids,
+                "names": r_names,
+                "orders": r_orders,
+                "competition_ranges": r_ranges,
+            },
+            "competitions": {
+                "ids": c_ids,
+                "names": c_names,
+                "orders": c_orders,
+            },
+        }
 
     def to_dynamodb_item(self, *, drop_none: bool = True) -> dict:
         """Serializa a un dict DynamoDB-friendly.
@@ -459,32 +531,22 @@ class SportbookConfig(BaseModel):
         - Enum     -> value
         - Decimal  -> se mantiene (si llegase a existir)
         """
-        from decimal import Decimal  # local para aclarar intención
-
-        def ser(x: Any) -> Any:
-            if isinstance(x, datetime):
-                return x.isoformat()
-            if isinstance(x, HttpUrl):
-                return str(x)
-            if isinstance(x, Enum):
-                return x.value
+        return serialize_for_dynamodb(self, drop_none=drop_none)
 
-            if isinstance(x, dict):
-                out = {k: ser(v) for k, v in x.items()}
-                return {k: v for k, v in out.items() if not (drop_none and v is None)}
-
-            if isinstance(x, list):
-                return [ser(v) for v in x]
-
-            if hasattr(x, "model_dump"):
-                return ser(x.model_dump())
-
-            if isinstance(x, Decimal):
-                return x
-
-            return x
+    @classmethod
+    def from_dynamodb_item(cls, item: dict) -> "SportbookConfig":
+        """Construye la config desde un item guardado en DynamoDB.
 
-        return ser(self.model_dump())
+        El árbol de tournaments (el más grande) se valida una sola vez con un
+        TypeAdapter de módulo; el contenedor recibe instancias ya construidas
+        y Pydantic no las vuelve a validar.
+        """
+        data = dict(item)
+        if data.get("tournaments") is not None:
+            data["tournaments"] = _TOURNAMENT_LIST_ADAPTER.validate_python(
+                data["tournaments"]
+            )
+        return cls.model_validate(data)
 
 
 # ===========================
@@ -494,16 +556,23 @@ class SportbookConfigDB(SportbookConfig):
     PK: Optional[str] = Field(default=None, description="Partition key")
     SK: Optional[str] = Field(default=None, description="Sort key")
 
+    @classmethod
+    def _with_keys(
+        cls, base: SportbookConfig, company_id: str
+    ) -> "SportbookConfigDB":
+        # `base` viene de un factory propio y PK/SK se fijan aquí: no hace
+        # falta re-validar el árbol ni pasar por _ensure_keys.
+        return cls.model_construct(
+            **dict(base), PK=company_pk(company_id), SK="sportbook_config"
+        )
+
     @classmethod
     def from_minimal_kambi(
         cls,
         company_id: str,
         **kwargs,
     ) -> "SportbookConfigDB":
-        base = SportbookConfig.from_minimal_kambi(**kwargs)
-        return cls(
-            **base.model_dump(), PK=f"company#{company_id}", SK="sportbook_config"
-        )
+        return cls._with_keys(SportbookConfig.from_minimal_kambi(**kwargs), company_id)
 
     @classmethod
     def from_minimal_phoenix(
@@ -511,10 +580,7 @@ class SportbookConfigDB(SportbookConfig):
         company_id: str,
         **kwargs,
     ) -> "SportbookConfigDB":
-        base = SportbookConfig.from_minimal_phoenix(**kwargs)
-        return cls(
-            **base.model_dump(), PK=f"company#{company_id}", SK="sportbook_config"
-        )
+        return cls._with_keys(SportbookConfig.from_minimal_phoenix(**kwargs), company_id)
 
     @classmethod
     def from_minimal_betsw3(
@@ -522,10 +588,7 @@ class SportbookConfigDB(SportbookConfig):
         company_id: str,
         **kwargs,
     ) -> "SportbookConfigDB":
-        base = SportbookConfig.from_minimal_betsw3(**kwargs)
-        return cls(
-            **base.model_dump(), PK=f"company#{company_id}", SK="sportbook_config"
-        )
+        return cls._with_keys(SportbookConfig.from_minimal_betsw3(**kwargs), company_id)
 
     @classmethod
     def from_minimal_digitain(
@@ -533,10 +596,7 @@ class SportbookConfigDB(SportbookConfig):
         company_id: str,
         **kwargs,
     ) -> "SportbookConfigDB":
-        base = SportbookConfig.from_minimal_digitain(**kwargs)
-        return cls(
-            **base.model_dump(), PK=f"company#{company_id}", SK="sportbook_config"
-        )
+        return cls._with_keys(SportbookConfig.from_minimal_digitain(**kwargs), company_id)
 
     @classmethod
     def from_minimal_plannatech(
@@ -544,10 +604,7 @@ class SportbookConfigDB(SportbookConfig):
         company_id: str,
         **kwargs,
     ) -> "SportbookConfigDB":
-        base = SportbookConfig.from_minimal_plannatech(**kwargs)
-        return cls(
-            **base.model_dump(), PK=f"company#{company_id}", SK="sportbook_config"
-        )
+        return cls._with_keys(SportbookConfig.from_minimal_plannatech(**kwargs), company_id)
 
     @classmethod
     def from_minimal_isolutions(
@@ -555,10 +612,7 @@ class SportbookConfigDB(SportbookConfig):
         company_id: str,
         **kwargs,
     ) -> "SportbookConfigDB":
-        base = SportbookConfig.from_minimal_isolutions(**kwargs)
-        return cls(
-            **base.model_dump(), PK=f"company#{company_id}", SK="sportbook_config"
-        )
+        return cls._with_keys(SportbookConfig.from_minimal_isolutions(**kwargs), company_id)
 
     @classmethod
     def from_minimal_betby(
@@ -566,14 +620,11 @@ class SportbookConfigDB(SportbookConfig):
         company_id: str,
         **kwargs,
     ) -> "SportbookConfigDB":
-        base = SportbookConfig.from_minimal_betby(**kwargs)
-        return cls(
-            **base.model_dump(), PK=f"company#{company_id}", SK="sportbook_config"
-        )
+        return cls._with_keys(SportbookConfig.from_minimal_betby(**kwargs), company_id)
 
     @model_validator(mode="after")
     def _ensure_keys(self) -> "SportbookConfigDB":
-        if not self.PK or not self.SK:
+        if not (self.PK and self.SK):
             raise ValueError("PK and SK are required for SportbookConfigDB")
         return self
 
@@ -4,35 +4,111 @@ Tutorial models for client video tutorials management
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
-from typing import Any, List, Optional
+import os
+import sys
+from datetime import datetime
+from typing import Annotated, Any, Iterable, List, NoReturn, Optional, Tuple
 from uuid import uuid4
 
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+from pydantic.alias_generators import to_camel
+
+from ._common import company_pk, serialize_for_dynamodb, utcnow
+
+
+# OpenAPI examples for the JSON schema. Only attached to the models when
+# PYDANTIC_EMIT_EXAMPLES=1 (e.g. when generating docs); workers skip them.
+EMIT_EXAMPLES = os.getenv("PYDANTIC_EMIT_EXAMPLES", "").lower() in ("1", "true")
+
+_EXAMPLES = {
+    "TutorialItemDB": {
+        "tutorial_id": "abc-123-uuid",
+        "s3_key": "betvip/tutorials/como-apostar.mp4",
+        "title": "Cómo realizar tu primera apuesta",
+        "file_name": "como-apostar.mp4",
+        "file_size": 15728640,
+        "file_type": "video/mp4",
+        "uploaded_at": "2026-01-05T14:30:00Z",
+    },
+    "TutorialVideo": {
+        "tutorialId": "abc-123-uuid",
+        "key": "betvip/tutorials/como-apostar.mp4",
+        "title": "Cómo realizar tu primera apuesta",
+        "url": "https://s3.amazonaws.com/...",
+        "fileName": "como-apostar.mp4",
+        "fileSize": 15728640,
+        "fileType": "video/mp4",
+        "uploadedAt": "2026-01-05T14:30:00Z",
+    },
+    "GetTutorialVideosResponse": {
+        "videos": [
+            {
+                "tutorialId": "abc-123",
+                "key": "betvip/tutorials/como-apostar.mp4",
+                "title": "Cómo Apostar",
+                "url": "https://s3.amazonaws.com/...",
+                "fileName": "como-apostar.mp4",
+                "fileSize": 15728640,
+                "fileType": "video/mp4",
+                "uploadedAt": "2026-01-05T14:30:00Z",
+            }
+        ],
+        "count": 1,
+    },
+    "UploadTutorialVideoResponse": {
+        "success": True,
+        "message": "Video uploaded successfully",
+        "videoUrl": "https://s3.amazonaws.com/...",
+        "videoKey": "betvip/tutorials/como-apostar.mp4",
+        "title": "Cómo Apostar",
+        "tutorialId": "abc-123-uuid",
+    },
+    "DeleteTutorialVideoResponse": {
+        "success": True,
+        "message": "Video deleted successfully",
+        "deletedKey": "betvip/tutorials/como-apostar.mp4",
+        "deletedTutorialId": "abc-123-uuid",
+    },
+}
+
+
+# MIME type: a handful of distinct values shared by every tutorial, so
+# interned to keep one str object per type in large lists.
+MimeType = Annotated[str, AfterValidator(sys.intern)]
+
+
+def _schema_example(name: str) -> Optional[dict]:
+    """json_schema_extra for ``name``, or None when examples are disabled"""
+    return {"example": _EXAMPLES[name]} if EMIT_EXAMPLES else None
+
 
 class TutorialItemDB(BaseModel):
     """Tutorial item stored in DynamoDB array"""
 
+    model_config = ConfigDict(
+        strict=True,
+        json_schema_extra=_schema_example("TutorialItemDB"),
+    )
+
     tutorial_id: str
     s3_key: str
     title: str
     file_name: str
-    file_size: int
-    file_type: str
+    # boto3 returns DynamoDB numbers as Decimal
+    file_size: int = Field(strict=False)
+    file_type: MimeType
     uploaded_at: str
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "tutorial_id": "abc-123-uuid",
-                "s3_key": "betvip/tutorials/como-apostar.mp4",
-                "title": "Cómo realizar tu primera apuesta",
-                "file_name": "como-apostar.mp4",
-                "file_size": 15728640,
-                "file_type": "video/mp4",
-                "uploaded_at": "2026-01-05T14:30:00Z",
-            }
-        }
+
+_TUTORIAL_LIST_ADAPTER = TypeAdapter(List[TutorialItemDB])
 
 
 # ===========================
@@ -48,8 +124,8 @@ class Tutorials(BaseModel):
         description="List of all tutorial videos",
     )
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     # Array-level validation
     @field_validator("tutorials")
@@ -58,11 +134,15 @@ class Tutorials(BaseModel):
         """Validate tutorials array"""
         if len(v) > 100:
             raise ValueError("Maximum 100 tutorials allowed")
+        if not v:
+            return v
 
-        # Check for duplicate tutorial_ids
-        ids = [t.tutorial_id for t in v]
-        if len(ids) != len(set(ids)):
-            raise ValueError("Duplicate tutorial_id found in tutorials array")
+        # Check for duplicate tutorial_ids, stopping at the first one
+        seen = set()
+        for t in v:
+            if t.tutorial_id in seen:
+                raise ValueError("Duplicate tutorial_id found in tutorials array")
+            seen.add(t.tutorial_id)
 
         return v
 
@@ -70,17 +150,31 @@ class Tutorials(BaseModel):
     @classmethod
     def from_minimal(cls) -> "Tutorials":
         """Create an empty tutorials config"""
-        now = datetime.now(timezone.utc)
+        now = utcnow()
         return cls(
             tutorials=[],
             created_at=now,
             updated_at=now,
         )
 
+    @classmethod
+    def from_dynamodb_item(cls, item: dict) -> "Tutorials":
+        """Build a config from a stored DynamoDB item.
+
+        The tutorials array is validated once through a module-level
+        TypeAdapter; the container then receives ready TutorialItemDB
+        instances, which Pydantic does not validate again.
+        """
+        data = dict(item)
+        data["tutorials"] = _TUTORIAL_LIST_ADAPTER.validate_python(
+            data.get("tutorials") or []
+        )
+        return cls.model_validate(data)
+
     # Utility methods
     def touch(self) -> None:
         """Update the updated_at timestamp"""
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = utcnow()
 
     def add_tutorial(
         self,
@@ -101,7 +195,7 @@ class Tutorials(BaseModel):
             file_name=file_name,
             file_size=file_size,
             file_type=file_type,
-            uploaded_at=uploaded_at or datetime.now(timezone.utc).isoformat(),
+            uploaded_at=uploaded_at or utcnow().isoformat(),
         )
         self.tutorials.append(tutorial)
         self.touch()
@@ -116,6 +210,16 @@ class Tutorials(BaseModel):
                 return True
         return False
 
+    def remove_tutorials(self, tutorial_ids: Iterable[str]) -> int:
+        """Remove tutorials by ID in one pass, keeping order; returns the count."""
+        ids = set(tutorial_ids)
+        kept = [t for t in self.tutorials if t.tutorial_id not in ids]
+        removed = len(self.tutorials) - len(kept)
+        if removed:
+            self.tutorials[:] = kept
+            self.touch()
+        return removed
+
     def get_tutorial(self, tutorial_id: str) -> Optional[TutorialItemDB]:
         """Get a tutorial by ID"""
         for tutorial in self.tutorials:
@@ -125,23 +229,7 @@ class Tutorials(BaseModel):
 
     def to_dynamodb_item(self, *, drop_none: bool = True) -> dict:
         """Serialize to DynamoDB-compatible dict"""
-        from enum import Enum
-
-        def ser(x: Any) -> Any:
-            if isinstance(x, datetime):
-                return x.isoformat()
-            if isinstance(x, Enum):
-                return x.value
-            if isinstance(x, dict):
-                out = {k: ser(v) for k, v in x.items()}
-                return {k: v for k, v in out.items() if not (drop_none and v is None)}
-            if isinstance(x, list):
-                return [ser(v) for v in x]
-            if hasattr(x, "model_dump"):
-                return ser(x.model_dump())
-            return x  # primitives
-
-        return ser(self.model_dump())
+        return serialize_for_dynamodb(self, drop_none=drop_none)
 
 
 # ===========================
@@ -156,129 +244,204 @@ class TutorialsDB(Tutorials):
     @classmethod
     def from_minimal(cls, company_id: str) -> "TutorialsDB":
         """Create an empty tutorials config for a company"""
-        base = Tutorials.from_minimal()
-        return cls(
-            **base.model_dump(),
-            PK=f"company#{company_id}",
+        # Keys are set here, so the trusted base skips re-validation
+        # (including _ensure_keys).
+        return cls.model_construct(
+            **dict(Tutorials.from_minimal()),
+            PK=company_pk(company_id),
             SK="tutorials",
         )
 
     @model_validator(mode="after")
     def _ensure_keys(self) -> "TutorialsDB":
         """Ensure PK and SK are set"""
-        if not self.PK or not self.SK:
+        if not (self.PK and self.SK):
             raise ValueError("PK and SK are required for TutorialsDB")
         return self
 
     # Inherits all utility methods from Tutorials
 
 
+class TutorialsDBRead(TutorialsDB):
+    """Read-only TutorialsDB for items already validated on write.
+
+    Built with ``model_construct`` (no validation) and frozen, with the
+    tutorials held in a tuple. Mutating helpers such as ``add_tutorial``
+    raise ``TypeError``; use ``TutorialsDB`` to modify and save.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    tutorials: Tuple[TutorialItemDB, ...] = ()
+
+    # Mutating helpers inherited from Tutorials fail with a clear error
+    def touch(self) -> NoReturn:
+        raise TypeError("TutorialsDBRead is read-only")
+
+    def add_tutorial(self, **kwargs: Any) -> NoReturn:
+        raise TypeError("TutorialsDBRead is read-only")
+
+    def remove_tutorial(self, tutorial_id: str) -> NoReturn:
+        raise TypeError("TutorialsDBRead is read-only")
+
+    def remove_tutorials(self, tutorial_ids: Iterable[str]) -> NoReturn:
+        raise TypeError("TutorialsDBRead is read-only")
+
+    @classmethod
+    def from_dynamodb_item(cls, item: dict) -> "TutorialsDBRead":
+        """Build a read-only config from a stored item without validation.
+
+        Only cheap normalisation is done: ISO timestamps are parsed,
+        numeric ``file_size`` values (boto3 returns ``Decimal``) become int
+        and ``file_type`` is interned like ``MimeType`` does on validation.
+        """
+        data = dict(item)
+        data["tutorials"] = tuple(
+            TutorialItemDB.model_construct(
+                **{
+                    **t,
+                    "file_size": int(t["file_size"]),
+                    "file_type": sys.intern(t["file_type"]),
+                }
+            )
+            for t in data.get("tutorials") or ()
+        )
+        for key in ("created_at", "updated_at"):
+            value = data.get(key)
+            if isinstance(value, str):
+                # fromisoformat only accepts a trailing "Z" from Python 3.11
+                if value.endswith("Z"):
+                    value = value[:-1] + "+00:00"
+                data[key] = datetime.fromisoformat(value)
+        return cls.model_construct(**data)
+
+
 class TutorialVideo(BaseModel):
     """Tutorial video model"""
 
-    tutorial_id: Optional[str] = Field(default=None, alias="tutorialId")
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+        json_schema_extra=_schema_example("TutorialVideo"),
+    )
+
+    tutorial_id: Optional[str] = None
     key: str
     title: str
     url: str
-    file_name: str = Field(alias="fileName")
-    file_size: int = Field(alias="fileSize")
-    file_type: str = Field(alias="fileType")
-    uploaded_at: Optional[str] = Field(default=None, alias="uploadedAt")
-
-    class Config:
-        populate_by_name = True
-        schema_extra = {
-            "example": {
-                "tutorialId": "abc-123-uuid",
-                "key": "betvip/tutorials/como-apostar.mp4",
-                "title": "Cómo realizar tu primera apuesta",
-                "url": "https://s3.amazonaws.com/...",
-                "fileName": "como-apostar.mp4",
-                "fileSize": 15728640,
-                "fileType": "video/mp4",
-                "uploadedAt": "2026-01-05T14:30:00Z",
-            }
-        }
+    file_name: str
+    file_size: int
+    file_type: MimeType
+    uploaded_at: Optional[str] = None
 
 
 class GetTutorialVideosResponse(BaseModel):
     """Response model for getting tutorial videos"""
 
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+        json_schema_extra=_schema_example("GetTutorialVideosResponse"),
+    )
+
     videos: List[TutorialVideo]
     count: int
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "videos": [
-                    {
-                        "tutorialId": "abc-123",
-                        "key": "betvip/tutorials/como-apostar.mp4",
-                        "title": "Cómo Apostar",
-                        "url": "https://s3.amazonaws.com/...",
-                        "fileName": "como-apostar.mp4",
-                        "fileSize": 15728640,
-                        "fileType": "video/mp4",
-                        "uploadedAt": "2026-01-05T14:30:00Z",
-                    }
-                ],
-                "count": 1,
-            }
-        }
+    @classmethod
+    def empty(cls) -> "GetTutorialVideosResponse":
+        """Response for no videos, built without validation.
 
+        A new instance is returned each time: ``videos`` is a list, so a
+        shared singleton could be mutated by a caller.
+        """
+        return cls.model_construct(videos=[], count=0)
 
-class UploadTutorialVideoResponse(BaseModel):
-    """Response model for uploading a tutorial video"""
+
+class _TutorialMutationResponse(BaseModel):
+    """Shared shape of the upload/delete responses"""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
 
     success: bool
     message: str
-    video_url: str = Field(alias="videoUrl")
-    video_key: str = Field(alias="videoKey")
+
+
+class UploadTutorialVideoResponse(_TutorialMutationResponse):
+    """Response model for uploading a tutorial video"""
+
+    model_config = ConfigDict(
+        json_schema_extra=_schema_example("UploadTutorialVideoResponse"),
+    )
+
+    video_url: str
+    video_key: str
     title: str
-    tutorial_id: str = Field(alias="tutorialId")
-
-    class Config:
-        populate_by_name = True
-        schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Video uploaded successfully",
-                "videoUrl": "https://s3.amazonaws.com/...",
-                "videoKey": "betvip/tutorials/como-apostar.mp4",
-                "title": "Cómo Apostar",
-                "tutorialId": "abc-123-uuid",
-            }
-        }
+    tutorial_id: str
+
+    @classmethod
+    def ok(
+        cls,
+        message: str,
+        *,
+        video_url: str,
+        video_key: str,
+        title: str,
+        tutorial_id: str,
+    ) -> "UploadTutorialVideoResponse":
+        """Build a success response from server-side values, without validation"""
+        return cls.model_construct(
+            success=True,
+            message=message,
+            video_url=video_url,
+            video_key=video_key,
+            title=title,
+            tutorial_id=tutorial_id,
+        )
 
 
-class DeleteTutorialVideoResponse(BaseModel):
+class DeleteTutorialVideoResponse(_TutorialMutationResponse):
     """Response model for deleting a tutorial video"""
 
-    success: bool
-    message: str
-    deleted_key: str = Field(alias="deletedKey")
-    deleted_tutorial_id: Optional[str] = Field(default=None, alias="deletedTutorialId")
-
-    class Config:
-        populate_by_name = True
-        schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Video deleted successfully",
-                "deletedKey": "betvip/tutorials/como-apostar.mp4",
-                "deletedTutorialId": "abc-123-uuid",
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_schema_example("DeleteTutorialVideoResponse"),
+    )
+
+    deleted_key: str
+    deleted_tutorial_id: Optional[str] = None
+
+    @classmethod
+    def ok(
+        cls,
+        message: str,
+        *,
+        deleted_key: str,
+        deleted_tutorial_id: Optional[str] = None,
+    ) -> "DeleteTutorialVideoResponse":
+        """Build a success response from server-side values, without validation"""
+        return cls.model_construct(
+            success=True,
+            message=message,
+            deleted_key=deleted_key,
+            deleted_tutorial_id=deleted_tutorial_id,
+        )
 
 
 class TutorialPriorityItem(BaseModel):
     """Tutorial priority item model"""
 
-    tutorial_id: str = Field(alias="tutorialId")
-    priority: int
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
-    class Config:
-        populate_by_name = True
+    tutorial_id: str
+    priority: int
 
 
 class UpdateTutorialPrioritiesRequest(BaseModel):
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from chatbet_base_models.message_template import MessageTemplates, MessageTemplatesDB
+from chatbet_base_models.site_config_model import Identity, SiteConfig, SiteConfigDB
+
+
+# Read-only: tests that mutate must work on a model_copy(deep=True)
+@pytest.fixture(scope="session")
+def minimal_templates():
+    return MessageTemplates.from_minimal()
+
+
+@pytest.fixture(scope="session")
+def minimal_dynamo_item(minimal_templates):
+    return minimal_templates.to_dynamodb_item()
+
+
+@pytest.fixture(scope="session")
+def minimal_templates_db():
+    return MessageTemplatesDB.from_minimal("test_company")
+
+
+@pytest.fixture
+def minimal_templates_copy(minimal_templates):
+    return minimal_templates.model_copy(deep=True)
+
+
+# Read-only like minimal_templates: tests that mutate must build their own
+@pytest.fixture(scope="session")
+def base_identity():
+    return Identity(
+        site_name="Test Site",
+        company_id="test123",
+        site_url="https://test.example.com",
+    )
+
+
+@pytest.fixture(scope="session")
+def default_site_config():
+    return SiteConfig.default_factory("Test Site", "test123")
+
+
+@pytest.fixture(scope="session")
+def default_site_config_db():
+    return SiteConfigDB.default_factory("Test Site", "test123")
+
+
+@pytest.fixture(scope="session")
+def site_config_dynamo_item(default_site_config_db):
+    return default_site_config_db.to_dynamodb_item()
+
+
+# One reference instant per module; offset it with timedelta for distinct times
+@pytest.fixture(scope="module")
+def now():
+    return datetime.now(timezone.utc)
@@ -0,0 +1,143 @@
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from pydantic import BaseModel, HttpUrl
+
+from chatbet_base_models._common import (
+    company_pk,
+    iter_batch_write_requests,
+    serialize_for_dynamodb,
+    utcnow,
+)
+from chatbet_base_models.promotion_config import PromotionsConfigDB
+from chatbet_base_models.site_config_model import OddType
+
+
+class _Child(BaseModel):
+    url: HttpUrl
+    odd_type: OddType
+
+
+class _Stamped(BaseModel):
+    name: str
+    when: datetime
+
+
+class TestUtcnow:
+    """Test the shared timestamp factory"""
+
+    def test_utcnow_is_timezone_aware(self):
+        """Test utcnow returns an aware UTC datetime"""
+        now = utcnow()
+        assert now.tzinfo is not None
+        assert now.utcoffset().total_seconds() == 0
+
+
+class TestCompanyPk:
+    """Test the shared partition key helper"""
+
+    def test_company_pk(self):
+        """Test company ids are prefixed with company#"""
+        assert company_pk("acme") == "company#acme"
+
+
+class TestSerializeForDynamodb:
+    """Test the shared DynamoDB serializer"""
+
+    def test_converts_special_types(self):
+        """Test datetime, Enum and HttpUrl conversion"""
+        now = datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+        result = serialize_for_dynamodb(
+            {
+                "when": now,
+                "odd_type": OddType.DECIMAL,
+                "child": _Child(url="https://example.com", odd_type="american"),
+            }
+        )
+        assert result["when"] == now.isoformat()
+        assert result["odd_type"] == "decimal"
+        assert result["child"] == {
+            "url": "https://example.com/",
+            "odd_type": "american",
+        }
+
+    def test_keeps_primitives_and_decimal(self):
+        """Test primitives and Decimal are passed through unchanged"""
+        value = {"a": 1, "b": 1.5, "c": True, "d": "x", "e": Decimal("2.50")}
+        assert serialize_for_dynamodb(value) == value
+
+    def test_drops_none_in_nested_dicts(self):
+        """Test None values are dropped from dicts at every level"""
+        value = {"a": None, "b": {"c": None, "d": 1}, "e": [None, {"f": None}]}
+        assert serialize_for_dynamodb(value) == {"b": {"d": 1}, "e": [None, {}]}
+
+    def test_keeps_none_when_disabled(self):
+        """Test drop_none=False keeps None values"""
+        value = {"a": None, "b": {"c": None}}
+        assert serialize_for_dynamodb(value, drop_none=False) == value
+
+    @pytest.mark.parametrize("drop_none", [True, False])
+    def test_model_matches_model_dump(self, drop_none):
+        """Test walking a model gives the same result as its model_dump()"""
+        config = PromotionsConfigDB.from_minimal("c1")
+        assert serialize_for_dynamodb(
+            config, drop_none=drop_none
+        ) == serialize_for_dynamodb(config.model_dump(), drop_none=drop_none)
+
+    def test_model_datetime_fields_are_isoformat(self):
+        """Test datetime fields on models are stored as ISO 8601 strings"""
+        now = datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+        result = serialize_for_dynamodb(_Stamped(name="x", when=now))
+        assert result == {"name": "x", "when": now.isoformat()}
+
+    def test_unvalidated_model_values_use_generic_path(self):
+        """Test values set without validation are still serialized by type"""
+        config = PromotionsConfigDB.from_minimal("c1")
+        config.updated_at = "2026-01-01T00:00:00+00:00"
+        stamped = _Stamped.model_construct(name=OddType.DECIMAL, when=None)
+
+        assert config.to_dynamodb_item()["updated_at"] == "2026-01-01T00:00:00+00:00"
+        assert serialize_for_dynamodb(stamped, drop_none=False) == {
+            "name": "decimal",
+            "when": None,
+        }
+
+    def test_tuples_become_lists(self):
+        """Test tuples are serialized as lists"""
+        assert serialize_for_dynamodb((1, OddType.DECIMAL)) == [1, "decimal"]
+
+    @pytest.mark.parametrize("drop_none", [True, False])
+    def test_list_of_models(self, drop_none):
+        """Test lists of models are serialized item by item"""
+        items = [_Child(url="https://a.com", odd_type="decimal")]
+        result = serialize_for_dynamodb(items, drop_none=drop_none)
+        assert result == [{"url": "https://a.com/", "odd_type": "decimal"}]
+
+
+class TestIterBatchWriteRequests:
+    """Test BatchWriteItem payload chunking"""
+
+    def test_chunks_models_into_batches_of_25(self):
+        """Test 60 configs are split into 25/25/10 put requests"""
+        configs = [PromotionsConfigDB.from_minimal(f"c{i}") for i in range(60)]
+        batches = list(iter_batch_write_requests(configs, "site-config"))
+
+        assert [len(b["site-config"]) for b in batches] == [25, 25, 10]
+        first = batches[0]["site-config"][0]["PutRequest"]["Item"]
+        assert first == configs[0].to_dynamodb_item()
+
+    def test_plain_dicts_are_sent_as_is(self):
+        """Test dict items are wrapped without serialization"""
+        batches = list(iter_batch_write_requests([{"PK": "a"}], "t", chunk=1))
+        assert batches == [{"t": [{"PutRequest": {"Item": {"PK": "a"}}}]}]
+
+    def test_empty_input_yields_nothing(self):
+        """Test no batches are produced for no items"""
+        assert list(iter_batch_write_requests([], "t")) == []
+
+    @pytest.mark.parametrize("chunk", [0, 26])
+    def test_invalid_chunk_raises_error(self, chunk):
+        """Test chunk sizes outside the DynamoDB limit are rejected"""
+        with pytest.raises(ValueError, match="chunk must be between"):
+            list(iter_batch_write_requests([], "t", chunk=chunk))
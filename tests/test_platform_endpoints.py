@@ -72,6 +72,13 @@ class TestEndpoint:
         )
         assert endpoint.method == HTTPMethod.DELETE
 
+    def test_repeated_url_reuses_parsed_instance(self):
+        url = "https://api.example.com/shared"
+        first = Endpoint(endpoint=url)
+        second = Endpoint(endpoint=url)
+        assert first.endpoint is second.endpoint
+        assert str(second.endpoint) == url
+
     def test_invalid_url_raises_error(self):
         with pytest.raises(ValueError):
             Endpoint(endpoint="not-a-valid-url")
@@ -93,99 +100,96 @@ class TestEndpoint:
 
 
 class TestEndpointGroups:
-    def test_auth_endpoints(self):
-        auth = AuthEndpoints(
-            validate_user=Endpoint(endpoint="https://api.example.com/auth/validate"),
-            validate_token=Endpoint(endpoint="https://api.example.com/auth/token"),
-        )
-        assert auth.validate_user is not None
-        assert auth.validate_token is not None
-        assert auth.generate_token is None
-        assert auth.generate_otp is None
-
-    def test_users_endpoints(self):
-        users = UsersEndpoints(
-            get_user_balance=Endpoint(endpoint="https://api.example.com/users/balance")
-        )
-        assert users.get_user_balance is not None
-
-    def test_sports_endpoints(self):
-        sports = SportsEndpoints(
-            get_available_sports=Endpoint(
-                endpoint="https://api.example.com/sports/available"
+    @pytest.mark.parametrize(
+        "group_cls, urls, unset",
+        [
+            (
+                AuthEndpoints,
+                {
+                    "validate_user": "https://api.example.com/auth/validate",
+                    "validate_token": "https://api.example.com/auth/token",
+                },
+                ("generate_token", "generate_otp"),
             ),
-            list_sports=Endpoint(endpoint="https://api.example.com/sports/list"),
-        )
-        assert sports.get_available_sports is not None
-        assert sports.list_sports is not None
-
-    def test_fixtures_endpoints(self):
-        fixtures = FixturesEndpoints(
-            get_fixtures_by_sport=Endpoint(
-                endpoint="https://api.example.com/fixtures/sport"
+            (
+                UsersEndpoints,
+                {"get_user_balance": "https://api.example.com/users/balance"},
+                (),
             ),
-            get_fixtures_by_tournament=Endpoint(
-                endpoint="https://api.example.com/fixtures/tournament"
+            (
+                SportsEndpoints,
+                {
+                    "get_available_sports": "https://api.example.com/sports/available",
+                    "list_sports": "https://api.example.com/sports/list",
+                },
+                (),
             ),
+            (
+                FixturesEndpoints,
+                {
+                    "get_fixtures_by_sport": "https://api.example.com/fixtures/sport",
+                    "get_fixtures_by_tournament": (
+                        "https://api.example.com/fixtures/tournament"
+                    ),
+                },
+                (
+                    "get_special_bets",
+                    "get_recommended_bets",
+                    "get_recommended_fixtures",
+                    "search_fixtures",
+                ),
+            ),
+            (
+                TournamentsEndpoints,
+                {"get_tournaments": "https://api.example.com/tournaments"},
+                (),
+            ),
+            (
+                OddsEndpoints,
+                {
+                    "get_fixture_odds": "https://api.example.com/odds/fixture",
+                    "get_odds_combo": "https://api.example.com/odds/combo",
+                },
+                (),
+            ),
+            (
+                BetsEndpoints,
+                {"place_bet": "https://api.example.com/bets/place"},
+                (),
+            ),
+            (
+                CombosEndpoints,
+                {
+                    "place_combo": "https://api.example.com/combos/place",
+                    "get_combo_profit": "https://api.example.com/combos/profit",
+                },
+                ("delete_bet_combo", "add_bet_to_combo", "get_odds_combo"),
+            ),
+            (
+                SportCatalogEndpoints,
+                {
+                    "get_sports": "https://api.example.com/catalog/sports",
+                    "get_regions": "https://api.example.com/catalog/regions",
+                    "get_tournaments": "https://api.example.com/catalog/tournaments",
+                    "get_markets": "https://api.example.com/catalog/markets",
+                },
+                (),
+            ),
+            (
+                SportCatalogEndpoints,
+                {"get_sports": "https://api.example.com/catalog/sports"},
+                ("get_regions", "get_tournaments", "get_markets"),
+            ),
+        ],
+    )
+    def test_group(self, group_cls, urls, unset):
+        group = group_cls(
+            **{field: Endpoint(endpoint=url) for field, url in urls.items()}
         )
-        assert fixtures.get_fixtures_by_sport is not None
-        assert fixtures.get_fixtures_by_tournament is not None
-        assert fixtures.get_special_bets is None
-        assert fixtures.get_recommended_bets is None
-        assert fixtures.get_recommended_fixtures is None
-        assert fixtures.search_fixtures is None
-
-    def test_tournaments_endpoints(self):
-        tournaments = TournamentsEndpoints(
-            get_tournaments=Endpoint(endpoint="https://api.example.com/tournaments")
-        )
-        assert tournaments.get_tournaments is not None
-
-    def test_odds_endpoints(self):
-        odds = OddsEndpoints(
-            get_fixture_odds=Endpoint(endpoint="https://api.example.com/odds/fixture"),
-            get_odds_combo=Endpoint(endpoint="https://api.example.com/odds/combo"),
-        )
-        assert odds.get_fixture_odds is not None
-        assert odds.get_odds_combo is not None
-
-    def test_bets_endpoints(self):
-        bets = BetsEndpoints(
-            place_bet=Endpoint(endpoint="https://api.example.com/bets/place")
-        )
-        assert bets.place_bet is not None
-
-    def test_combos_endpoints(self):
-        combos = CombosEndpoints(
-            place_combo=Endpoint(endpoint="https://api.example.com/combos/place"),
-            get_combo_profit=Endpoint(endpoint="https://api.example.com/combos/profit"),
-        )
-        assert combos.place_combo is not None
-        assert combos.get_combo_profit is not None
-        assert combos.delete_bet_combo is None
-        assert combos.add_bet_to_combo is None
-        assert combos.get_odds_combo is None
-
-    def test_sport_catalog_endpoints(self):
-        catalog = SportCatalogEndpoints(
-            get_sports=Endpoint(endpoint="https://api.example.com/catalog/sports"),
-            get_regions=Endpoint(endpoint="https://api.example.com/catalog/regions"),
-            get_tournaments=Endpoint(endpoint="https://api.example.com/catalog/tournaments"),
-            get_markets=Endpoint(endpoint="https://api.example.com/catalog/markets"),
-        )
-        assert catalog.get_sports is not None
-        assert catalog.get_regions is not None
-        assert catalog.get_tournaments is not None
-        assert catalog.get_markets is not None
-
-    def test_sport_catalog_endpoints_partial(self):
-        catalog = SportCatalogEndpoints(
-            get_sports=Endpoint(endpoint="https://api.example.com/catalog/sports"),
-        )
-        assert catalog.get_sports is not None
-        assert catalog.get_regions is None
-        assert catalog.get_tournaments is None
-        assert catalog.get_markets is None
+        for field in urls:
+            assert getattr(group, field) is not None
+        for field in unset:
+            assert getattr(group, field) is None
 
     def test_sport_catalog_endpoints_extra_fields_forbidden(self):
         with pytest.raises(ValueError):
@@ -262,6 +266,15 @@ class TestAPIEndpointsDB:
         assert api_db.auth.validate_user.method == HTTPMethod.POST
         assert api_db.users.get_user_balance.method == HTTPMethod.GET
 
+    def test_default_factory_instances_are_independent(self):
+        first = APIEndpointsDB.default_factory("a")
+        first.markets.markets_priorities.params["language"] = "en"
+        second = APIEndpointsDB.default_factory("b")
+
+        assert second.PK == "company#b"
+        assert second.markets.markets_priorities.params["language"] == "es"
+        assert second.auth.validate_user is not first.auth.validate_user
+
     def test_default_factory_complete_endpoints(self):
         api_db = APIEndpointsDB.default_factory("test_company")
 
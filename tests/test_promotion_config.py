@@ -9,15 +9,30 @@ from chatbet_base_models.promotion_config import (
 )
 
 
+@pytest.fixture
+def make_promo(now):
+    """Build a valid PromotionItem, overriding only the given fields"""
+
+    def _make(**overrides):
+        fields = dict(
+            title="Sale",
+            start_date=now,
+            end_date=now + timedelta(days=1),
+            details="Details",
+        )
+        fields.update(overrides)
+        return PromotionItem(**fields)
+
+    return _make
+
+
 class TestPromotionItem:
     """Test individual promotion item model"""
 
-    def test_create_promotion_item(self):
+    def test_create_promotion_item(self, make_promo, now):
         """Test creating a promotion item"""
-        now = datetime.now(timezone.utc)
-        item = PromotionItem(
+        item = make_promo(
             title="Summer Sale",
-            start_date=now,
             end_date=now + timedelta(days=30),
             details="Get 50% off",
             keywords=["summer", "sale"],
@@ -25,159 +40,72 @@ class TestPromotionItem:
         assert item.title == "Summer Sale"
         assert len(item.keywords) == 2
         assert isinstance(item.promotion_id, str)
-        UUID(item.promotion_id)  # Validate UUID format
+        assert item.promotion_id == str(UUID(item.promotion_id))  # Dashed UUID
 
-    def test_create_promotion_item_minimal(self):
+    def test_create_promotion_item_minimal(self, make_promo):
         """Test creating promotion item with minimal fields"""
-        now = datetime.now(timezone.utc)
-        item = PromotionItem(
-            title="Black Friday",
-            start_date=now,
-            end_date=now + timedelta(days=1),
-            details="Huge discounts!",
-        )
+        item = make_promo(title="Black Friday", details="Huge discounts!")
         assert item.title == "Black Friday"
         assert item.keywords == []  # Default empty list
 
-    def test_title_validation_strips_whitespace(self):
+    def test_title_validation_strips_whitespace(self, make_promo):
         """Test that title whitespace is stripped"""
-        now = datetime.now(timezone.utc)
-        item = PromotionItem(
-            title="  Holiday Sale  ",
-            start_date=now,
-            end_date=now + timedelta(days=1),
-            details="Details",
-        )
-        assert item.title == "Holiday Sale"
+        assert make_promo(title="  Holiday Sale  ").title == "Holiday Sale"
 
-    def test_title_validation_empty_raises_error(self):
+    def test_title_validation_empty_raises_error(self, make_promo):
         """Test that empty title raises validation error"""
-        now = datetime.now(timezone.utc)
         with pytest.raises(ValueError, match="Title cannot be empty"):
-            PromotionItem(
-                title="   ",
-                start_date=now,
-                end_date=now + timedelta(days=1),
-                details="Details",
-            )
+            make_promo(title="   ")
 
-    def test_title_validation_purely_numeric_raises_error(self):
+    def test_title_validation_purely_numeric_raises_error(self, make_promo):
         """Test that purely numeric title raises error"""
-        now = datetime.now(timezone.utc)
         with pytest.raises(ValueError, match="purely numeric"):
-            PromotionItem(
-                title="12345",
-                start_date=now,
-                end_date=now + timedelta(days=1),
-                details="Details",
-            )
+            make_promo(title="12345")
 
-    def test_keywords_validation_normalizes(self):
+    def test_keywords_validation_normalizes(self, make_promo):
         """Test keyword normalization (lowercase, trim)"""
-        now = datetime.now(timezone.utc)
-        item = PromotionItem(
-            title="Sale",
-            keywords=["  SUMMER  ", "Sale", "DISCOUNT"],
-            start_date=now,
-            end_date=now + timedelta(days=1),
-            details="Details",
-        )
+        item = make_promo(keywords=["  SUMMER  ", "Sale", "DISCOUNT"])
         assert item.keywords == ["summer", "sale", "discount"]
 
-    def test_keywords_validation_removes_duplicates(self):
+    def test_keywords_validation_removes_duplicates(self, make_promo):
         """Test that duplicate keywords are removed"""
-        now = datetime.now(timezone.utc)
-        item = PromotionItem(
-            title="Sale",
-            keywords=["summer", "sale", "summer", "discount", "sale"],
-            start_date=now,
-            end_date=now + timedelta(days=1),
-            details="Details",
-        )
+        item = make_promo(keywords=["summer", "sale", "summer", "discount", "sale"])
         assert item.keywords == ["summer", "sale", "discount"]
 
-    def test_keywords_validation_removes_empty(self):
+    def test_keywords_validation_removes_empty(self, make_promo):
         """Test that empty keywords are removed"""
-        now = datetime.now(timezone.utc)
-        item = PromotionItem(
-            title="Sale",
-            keywords=["summer", "", "  ", "sale"],
-            start_date=now,
-            end_date=now + timedelta(days=1),
-            details="Details",
-        )
+        item = make_promo(keywords=["summer", "", "  ", "sale"])
         assert item.keywords == ["summer", "sale"]
 
-    def test_keywords_validation_max_length(self):
+    def test_keywords_validation_max_length(self, make_promo):
         """Test keyword max length validation"""
-        now = datetime.now(timezone.utc)
-        long_keyword = "a" * 51
         with pytest.raises(ValueError, match="Keyword too long"):
-            PromotionItem(
-                title="Sale",
-                keywords=[long_keyword],
-                start_date=now,
-                end_date=now + timedelta(days=1),
-                details="Details",
-            )
+            make_promo(keywords=["a" * 51])
 
-    def test_keywords_validation_max_count(self):
+    def test_keywords_validation_max_count(self, make_promo):
         """Test maximum keywords count"""
-        now = datetime.now(timezone.utc)
-        keywords = [f"keyword{i}" for i in range(21)]
         with pytest.raises(ValueError, match="Maximum 20 keywords"):
-            PromotionItem(
-                title="Sale",
-                keywords=keywords,
-                start_date=now,
-                end_date=now + timedelta(days=1),
-                details="Details",
-            )
+            make_promo(keywords=[f"keyword{i}" for i in range(21)])
 
-    def test_details_validation_empty_raises_error(self):
+    def test_details_validation_empty_raises_error(self, make_promo):
         """Test that empty details raises error"""
-        now = datetime.now(timezone.utc)
         with pytest.raises(ValueError, match="Details cannot be empty"):
-            PromotionItem(
-                title="Sale",
-                start_date=now,
-                end_date=now + timedelta(days=1),
-                details="   ",
-            )
+            make_promo(details="   ")
 
-    def test_date_validation_end_before_start_raises_error(self):
+    def test_date_validation_end_before_start_raises_error(self, make_promo, now):
         """Test that end_date before start_date raises error"""
-        now = datetime.now(timezone.utc)
         with pytest.raises(ValueError, match="end_date must be after start_date"):
-            PromotionItem(
-                title="Sale",
-                start_date=now + timedelta(days=10),
-                end_date=now,
-                details="Details",
-            )
+            make_promo(start_date=now + timedelta(days=10), end_date=now)
 
-    def test_date_validation_end_equals_start_raises_error(self):
+    def test_date_validation_end_equals_start_raises_error(self, make_promo, now):
         """Test that end_date equal to start_date raises error"""
-        now = datetime.now(timezone.utc)
         with pytest.raises(ValueError, match="end_date must be after start_date"):
-            PromotionItem(
-                title="Sale",
-                start_date=now,
-                end_date=now,
-                details="Details",
-            )
+            make_promo(end_date=now)
 
-    def test_extra_fields_forbidden(self):
+    def test_extra_fields_forbidden(self, make_promo):
         """Test that extra fields are rejected"""
-        now = datetime.now(timezone.utc)
         with pytest.raises(ValueError):
-            PromotionItem(
-                title="Sale",
-                start_date=now,
-                end_date=now + timedelta(days=1),
-                details="Details",
-                extra_field="not allowed",
-            )
+            make_promo(extra_field="not allowed")
 
 
 class TestPromotionsConfig:
@@ -190,10 +118,9 @@ class TestPromotionsConfig:
         assert isinstance(config.created_at, datetime)
         assert isinstance(config.updated_at, datetime)
 
-    def test_add_promotion(self):
+    def test_add_promotion(self, now):
         """Test adding promotions to array"""
         config = PromotionsConfig.from_minimal()
-        now = datetime.now(timezone.utc)
 
         promo = config.add_promotion(
             title="Black Friday",
@@ -208,10 +135,9 @@ class TestPromotionsConfig:
         assert promo.title == "Black Friday"
         assert len(promo.keywords) == 2
 
-    def test_add_multiple_promotions(self):
+    def test_add_multiple_promotions(self, now):
         """Test adding multiple promotions"""
         config = PromotionsConfig.from_minimal()
-        now = datetime.now(timezone.utc)
 
         promo1 = config.add_promotion(
             title="First",
@@ -231,10 +157,9 @@ class TestPromotionsConfig:
         assert config.promotions[0] == promo1
         assert config.promotions[1] == promo2
 
-    def test_add_promotion_with_custom_id(self):
+    def test_add_promotion_with_custom_id(self, now):
         """Test adding promotion with custom ID"""
         config = PromotionsConfig.from_minimal()
-        now = datetime.now(timezone.utc)
 
         promo = config.add_promotion(
             title="Custom ID",
@@ -246,10 +171,81 @@ class TestPromotionsConfig:
 
         assert promo.promotion_id == "custom-id-123"
 
-    def test_remove_promotion(self):
+    def test_add_promotion_duplicate_id_raises_error(self, now):
+        """Test add_promotion rejects an id already in the array"""
+        config = PromotionsConfig.from_minimal()
+        kwargs = dict(
+            title="Sale",
+            start_date=now,
+            end_date=now + timedelta(days=1),
+            details="Details",
+            promotion_id="dup",
+        )
+        config.add_promotion(**kwargs)
+
+        with pytest.raises(ValueError, match="Duplicate promotion_id"):
+            config.add_promotion(**kwargs)
+        assert len(config.promotions) == 1
+
+        # A removed id can be reused
+        config.remove_promotion("dup")
+        config.add_promotion(**kwargs)
+        assert config.get_promotion("dup") is config.promotions[0]
+
+    def test_add_promotion_duplicate_of_direct_append_raises_error(self, make_promo):
+        """Test ids appended straight to the list are seen by add_promotion"""
+        config = PromotionsConfig.from_minimal()
+        config.promotions.append(make_promo(promotion_id="dup"))
+
+        with pytest.raises(ValueError, match="Duplicate promotion_id"):
+            config.add_promotion(
+                title="Sale",
+                start_date=config.promotions[0].start_date,
+                end_date=config.promotions[0].end_date,
+                details="Details",
+                promotion_id="dup",
+            )
+        assert len(config.promotions) == 1
+
+    def test_add_promotion_new_id_keeps_index(self, make_promo, now):
+        """Test adding an explicit new id is an O(1) check plus an insert"""
+        config = PromotionsConfig(promotions=[make_promo(promotion_id="a")])
+        index = config._id_index
+
+        config.add_promotion(
+            title="Sale",
+            start_date=now,
+            end_date=now + timedelta(days=1),
+            details="Details",
+            promotion_id="b",
+        )
+
+        assert config._id_index is index
+        assert index == {"a": 0, "b": 1}
+
+    def test_add_promotion_over_limit_raises_error(self, now):
+        """Test add_promotion enforces the 100 promotions cap"""
+        config = PromotionsConfig.from_minimal()
+        for i in range(100):
+            config.add_promotion(
+                title=f"Promo{i}",
+                start_date=now,
+                end_date=now + timedelta(days=1),
+                details="Details",
+            )
+
+        with pytest.raises(ValueError, match="Maximum 100 promotions"):
+            config.add_promotion(
+                title="Promo100",
+                start_date=now,
+                end_date=now + timedelta(days=1),
+                details="Details",
+            )
+        assert len(config.promotions) == 100
+
+    def test_remove_promotion(self, now):
         """Test removing promotion by ID"""
         config = PromotionsConfig.from_minimal()
-        now = datetime.now(timezone.utc)
 
         promo = config.add_promotion(
             title="Sale",
@@ -263,16 +259,32 @@ class TestPromotionsConfig:
         assert removed is True
         assert len(config.promotions) == 0
 
+    def test_remove_promotions_keeps_order(self, now):
+        """Test bulk removal by ID keeps the remaining order"""
+        config = PromotionsConfig.from_minimal()
+        ids = [
+            config.add_promotion(
+                title=f"Promo {i}",
+                start_date=now,
+                end_date=now + timedelta(days=1),
+                details="Details",
+            ).promotion_id
+            for i in range(4)
+        ]
+
+        assert config.remove_promotions({ids[0], ids[2], "nonexistent-id"}) == 2
+        assert [p.promotion_id for p in config.promotions] == [ids[1], ids[3]]
+        assert config.remove_promotions(["nonexistent-id"]) == 0
+
     def test_remove_promotion_not_found(self):
         """Test removing non-existent promotion returns False"""
         config = PromotionsConfig.from_minimal()
         removed = config.remove_promotion("nonexistent-id")
         assert removed is False
 
-    def test_get_promotion(self):
+    def test_get_promotion(self, now):
         """Test getting promotion by ID"""
         config = PromotionsConfig.from_minimal()
-        now = datetime.now(timezone.utc)
 
         promo = config.add_promotion(
             title="Sale",
@@ -285,16 +297,56 @@ class TestPromotionsConfig:
         assert found == promo
         assert found.title == "Sale"
 
+    def test_lookups_keep_order_and_follow_direct_list_edits(self, now):
+        """Test id lookups after removals and after editing the list directly"""
+        config = PromotionsConfig.from_minimal()
+        ids = [
+            config.add_promotion(
+                title=f"Promo {i}",
+                start_date=now,
+                end_date=now + timedelta(days=1),
+                details="Details",
+            ).promotion_id
+            for i in range(4)
+        ]
+
+        assert config.remove_promotion(ids[1]) is True
+        assert [p.promotion_id for p in config.promotions] == [ids[0], ids[2], ids[3]]
+        assert config.get_promotion(ids[3]).title == "Promo 3"
+
+        config.promotions.reverse()
+        assert config.get_promotion(ids[0]).title == "Promo 0"
+        assert config.remove_promotion(ids[0]) is True
+        assert config.get_promotion(ids[0]) is None
+        assert config == PromotionsConfig.model_validate(config.model_dump())
+
+    def test_lookup_misses_do_not_rebuild_index(self, make_promo):
+        """Test unknown ids are answered from the index without a rebuild"""
+        config = PromotionsConfig(promotions=[make_promo(promotion_id="a")])
+        index = config._id_index
+
+        assert config.get_promotion("missing") is None
+        assert config.remove_promotion("missing") is False
+        assert config._id_index is index
+
+    def test_model_copy_gets_its_own_index(self, make_promo):
+        """Test copies do not share the id index with the original"""
+        config = PromotionsConfig(promotions=[make_promo(promotion_id="a")])
+        copied = config.model_copy(update={"promotions": []})
+
+        assert copied._id_index is not config._id_index
+        assert copied.get_promotion("a") is None
+        assert config.get_promotion("a") is config.promotions[0]
+
     def test_get_promotion_not_found(self):
         """Test getting non-existent promotion returns None"""
         config = PromotionsConfig.from_minimal()
         not_found = config.get_promotion("nonexistent")
         assert not_found is None
 
-    def test_get_active_promotions(self):
+    def test_get_active_promotions(self, now):
         """Test filtering active promotions"""
         config = PromotionsConfig.from_minimal()
-        now = datetime.now(timezone.utc)
 
         # Active promotion
         config.add_promotion(
@@ -330,9 +382,8 @@ class TestPromotionsConfig:
         active = config.get_active_promotions()
         assert active == []
 
-    def test_duplicate_id_validation(self):
+    def test_duplicate_id_validation(self, now):
         """Test duplicate promotion_id validation"""
-        now = datetime.now(timezone.utc)
         item1 = PromotionItem(
             promotion_id="same-id",
             title="First",
@@ -351,15 +402,17 @@ class TestPromotionsConfig:
         with pytest.raises(ValueError, match="Duplicate promotion_id"):
             PromotionsConfig(promotions=[item1, item2])
 
-    def test_max_promotions_validation(self):
+    def test_max_promotions_validation(self, now):
         """Test maximum promotions validation"""
-        now = datetime.now(timezone.utc)
+        # Only the array check is under test: skip per-item validation
         promotions = [
-            PromotionItem(
+            PromotionItem.model_construct(
+                promotion_id=f"promo-{i}",
                 title=f"Promo{i}",
                 start_date=now,
                 end_date=now + timedelta(days=1),
                 details="Details",
+                keywords=[],
             )
             for i in range(101)
         ]
@@ -375,12 +428,11 @@ class TestPromotionsConfig:
         config.touch()
         assert config.updated_at > original
 
-    def test_add_promotion_calls_touch(self):
+    def test_add_promotion_calls_touch(self, now):
         """Test that add_promotion updates timestamp"""
         config = PromotionsConfig.from_minimal()
         config.updated_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
         original = config.updated_at
-        now = datetime.now(timezone.utc)
 
         config.add_promotion(
             title="Test",
@@ -391,10 +443,9 @@ class TestPromotionsConfig:
 
         assert config.updated_at > original
 
-    def test_remove_promotion_calls_touch(self):
+    def test_remove_promotion_calls_touch(self, now):
         """Test that remove_promotion updates timestamp"""
         config = PromotionsConfig.from_minimal()
-        now = datetime.now(timezone.utc)
 
         promo = config.add_promotion(
             title="Test",
@@ -408,10 +459,9 @@ class TestPromotionsConfig:
         config.remove_promotion(promo.promotion_id)
         assert config.updated_at > original
 
-    def test_to_dynamodb_item(self):
+    def test_to_dynamodb_item(self, now):
         """Test DynamoDB serialization"""
         config = PromotionsConfig.from_minimal()
-        now = datetime.now(timezone.utc)
 
         config.add_promotion(
             title="Test",
@@ -446,10 +496,18 @@ class TestPromotionsConfigDB:
         with pytest.raises(ValueError, match="PK and SK are required"):
             PromotionsConfigDB(promotions=[])
 
-    def test_inherits_add_promotion(self):
+    def test_bulk_from_minimal(self):
+        """Test bulk creation shares one timestamp but not the promotions list"""
+        configs = PromotionsConfigDB.bulk_from_minimal(["a", "b", "c"])
+
+        assert [c.PK for c in configs] == ["company#a", "company#b", "company#c"]
+        assert all(c.SK == "promotions_config" for c in configs)
+        assert len({c.created_at for c in configs}) == 1
+        assert configs[0].promotions is not configs[1].promotions
+
+    def test_inherits_add_promotion(self, now):
         """Test that DB variant inherits add_promotion method"""
         config = PromotionsConfigDB.from_minimal(company_id="company123")
-        now = datetime.now(timezone.utc)
 
         promo = config.add_promotion(
             title="Test",
@@ -461,10 +519,9 @@ class TestPromotionsConfigDB:
         assert len(config.promotions) == 1
         assert config.promotions[0] == promo
 
-    def test_inherits_remove_promotion(self):
+    def test_inherits_remove_promotion(self, now):
         """Test that DB variant inherits remove_promotion method"""
         config = PromotionsConfigDB.from_minimal(company_id="company123")
-        now = datetime.now(timezone.utc)
 
         promo = config.add_promotion(
             title="Test",
@@ -477,10 +534,9 @@ class TestPromotionsConfigDB:
         assert removed is True
         assert len(config.promotions) == 0
 
-    def test_inherits_get_promotion(self):
+    def test_inherits_get_promotion(self, now):
         """Test that DB variant inherits get_promotion method"""
         config = PromotionsConfigDB.from_minimal(company_id="company123")
-        now = datetime.now(timezone.utc)
 
         promo = config.add_promotion(
             title="Test",
@@ -492,10 +548,9 @@ class TestPromotionsConfigDB:
         found = config.get_promotion(promo.promotion_id)
         assert found == promo
 
-    def test_inherits_get_active_promotions(self):
+    def test_inherits_get_active_promotions(self, now):
         """Test that DB variant inherits get_active_promotions method"""
         config = PromotionsConfigDB.from_minimal(company_id="company123")
-        now = datetime.now(timezone.utc)
 
         config.add_promotion(
             title="Active",
@@ -525,10 +580,9 @@ class TestPromotionsConfigDB:
         assert item["PK"] == "company#company123"
         assert item["SK"] == "promotions_config"
 
-    def test_to_dynamodb_item_with_promotions(self):
+    def test_to_dynamodb_item_with_promotions(self, now):
         """Test serialization with promotions in array"""
         config = PromotionsConfigDB.from_minimal(company_id="company123")
-        now = datetime.now(timezone.utc)
 
         config.add_promotion(
             title="Test",
@@ -541,3 +595,36 @@ class TestPromotionsConfigDB:
         assert "promotions" in item
         assert isinstance(item["promotions"], list)
         assert len(item["promotions"]) == 1
+
+    def test_from_dynamodb_item_round_trip(self, now):
+        """Test loading a stored item rebuilds the same config"""
+        config = PromotionsConfigDB.from_minimal(company_id="company123")
+        config.add_promotion(
+            title="Test",
+            start_date=now,
+            end_date=now + timedelta(days=1),
+            details="Details",
+            keywords=["test"],
+        )
+
+        loaded = PromotionsConfigDB.from_dynamodb_item(config.to_dynamodb_item())
+
+        assert isinstance(loaded, PromotionsConfigDB)
+        assert loaded == config
+        assert isinstance(loaded.promotions[0], PromotionItem)
+
+    def test_from_dynamodb_item_still_validates(self, now):
+        """Test stored items go through array and key validation"""
+        item = PromotionsConfigDB.from_minimal(company_id="c1").to_dynamodb_item()
+        promo = {
+            "promotion_id": "dup",
+            "title": "Test",
+            "start_date": now,
+            "end_date": now + timedelta(days=1),
+            "details": "Details",
+        }
+
+        with pytest.raises(ValueError, match="Duplicate promotion_id"):
+            PromotionsConfigDB.from_dynamodb_item({**item, "promotions": [promo] * 2})
+        with pytest.raises(ValueError, match="PK and SK are required"):
+            PromotionsConfigDB.from_dynamodb_item({"promotions": []})
@@ -32,81 +32,75 @@ from chatbet_base_models.site_config_model import (
     PersonalityConfig,
 )
 
+_FIXED_DT = datetime(2024, 1, 1, 12, 0, 0)
 
-class TestEnums:
-    def test_odd_type_enum(self):
-        assert OddType.AMERICAN == "american"
-        assert OddType.DECIMAL == "decimal"
-
-    def test_validation_method_enum(self):
-        assert ValidationMethod.PHONE == "phone"
-        assert ValidationMethod.EMAIL == "email"
-
-    def test_twilio_auth_channel_enum(self):
-        assert TwilioAuthChannel.SMS == "sms"
-        assert TwilioAuthChannel.WHATSAPP == "whatsapp"
-        assert TwilioAuthChannel.EMAIL == "email"
-
-    def test_chatbet_version_enum(self):
-        assert ChatbetVersion.V1 == "v1"
-        assert ChatbetVersion.V2 == "v2"
+_TWILIO_KWARGS = dict(
+    verify_service_sid="VAxxxxxxx",
+    auth_token="auth_token",
+    account_sid="ACxxxxxxx",
+)
 
-    def test_whatsapp_provider_enum(self):
-        assert WhatsAppProvider.WHAPI == "whapi"
-        assert WhatsAppProvider.META == "meta"
 
-    def test_alias_probabilities_enum(self):
-        assert AliasProbabilities.CUOTA == "cuota"
-        assert AliasProbabilities.MOMIO == "momio"
-        assert AliasProbabilities.ODD == "odd"
+class TestEnums:
+    @pytest.mark.parametrize(
+        "member, value",
+        [
+            (OddType.AMERICAN, "american"),
+            (OddType.DECIMAL, "decimal"),
+            (ValidationMethod.PHONE, "phone"),
+            (ValidationMethod.EMAIL, "email"),
+            (TwilioAuthChannel.SMS, "sms"),
+            (TwilioAuthChannel.WHATSAPP, "whatsapp"),
+            (TwilioAuthChannel.EMAIL, "email"),
+            (ChatbetVersion.V1, "v1"),
+            (ChatbetVersion.V2, "v2"),
+            (WhatsAppProvider.WHAPI, "whapi"),
+            (WhatsAppProvider.META, "meta"),
+            (AliasProbabilities.CUOTA, "cuota"),
+            (AliasProbabilities.MOMIO, "momio"),
+            (AliasProbabilities.ODD, "odd"),
+        ],
+    )
+    def test_enum_values(self, member, value):
+        assert member == value
 
 
 class TestMoneyLimits:
-    def test_create_money_limits(self):
-        limits = MoneyLimits(
-            min_bet_amount=Decimal("1.00"), max_bet_amount=Decimal("100.00")
-        )
-        assert limits.min_bet_amount == Decimal("1.00")
-        assert limits.max_bet_amount == Decimal("100.00")
-
-    def test_convert_string_to_decimal(self):
-        limits = MoneyLimits(min_bet_amount="1.50", max_bet_amount="50.00")
-        assert limits.min_bet_amount == Decimal("1.50")
-        assert limits.max_bet_amount == Decimal("50.00")
-
-    def test_convert_int_to_decimal(self):
-        limits = MoneyLimits(min_bet_amount=1, max_bet_amount=100)
-        assert limits.min_bet_amount == Decimal("1")
-        assert limits.max_bet_amount == Decimal("100")
-
-    def test_convert_float_to_decimal(self):
-        limits = MoneyLimits(min_bet_amount=1.5, max_bet_amount=100.5)
-        assert limits.min_bet_amount == Decimal("1.5")
-        assert limits.max_bet_amount == Decimal("100.5")
-
-    def test_invalid_amount_raises_error(self):
-        with pytest.raises(ValueError, match="Invalid amount"):
-            MoneyLimits(min_bet_amount="invalid", max_bet_amount="100")
-
-    def test_negative_min_bet_raises_error(self):
-        with pytest.raises(ValueError):
-            MoneyLimits(min_bet_amount=Decimal("-1"), max_bet_amount=Decimal("100"))
-
-    def test_zero_max_bet_raises_error(self):
-        with pytest.raises(ValueError):
-            MoneyLimits(min_bet_amount=Decimal("0"), max_bet_amount=Decimal("0"))
-
-    def test_max_less_than_min_raises_error(self):
-        with pytest.raises(
-            ValueError, match="max_bet_amount must be greater than min_bet_amount"
-        ):
-            MoneyLimits(min_bet_amount=Decimal("100"), max_bet_amount=Decimal("50"))
-
-    def test_max_equal_to_min_raises_error(self):
-        with pytest.raises(
-            ValueError, match="max_bet_amount must be greater than min_bet_amount"
-        ):
-            MoneyLimits(min_bet_amount=Decimal("100"), max_bet_amount=Decimal("100"))
+    @pytest.mark.parametrize(
+        "min_bet, max_bet, expected_min, expected_max",
+        [
+            (Decimal("1.00"), Decimal("100.00"), Decimal("1.00"), Decimal("100.00")),
+            ("1.50", "50.00", Decimal("1.50"), Decimal("50.00")),
+            (1, 100, Decimal("1"), Decimal("100")),
+            (1.5, 100.5, Decimal("1.5"), Decimal("100.5")),
+        ],
+    )
+    def test_convert_to_decimal(self, min_bet, max_bet, expected_min, expected_max):
+        limits = MoneyLimits(min_bet_amount=min_bet, max_bet_amount=max_bet)
+        assert limits.min_bet_amount == expected_min
+        assert limits.max_bet_amount == expected_max
+
+    @pytest.mark.parametrize(
+        "min_bet, max_bet, match",
+        [
+            ("invalid", "100", "Invalid amount"),
+            (Decimal("-1"), Decimal("100"), None),
+            (Decimal("0"), Decimal("0"), None),
+            (
+                Decimal("100"),
+                Decimal("50"),
+                "max_bet_amount must be greater than min_bet_amount",
+            ),
+            (
+                Decimal("100"),
+                Decimal("100"),
+                "max_bet_amount must be greater than min_bet_amount",
+            ),
+        ],
+    )
+    def test_invalid_limits_raise_error(self, min_bet, max_bet, match):
+        with pytest.raises(ValueError, match=match):
+            MoneyLimits(min_bet_amount=min_bet, max_bet_amount=max_bet)
 
 
 class TestTestConfig:
@@ -177,68 +171,35 @@ class TestIntegrationConfigs:
         assert config.index.fixtures == "fixtures"
 
     def test_twilio_config(self):
-        config = TwilioConfig(
-            verify_service_sid="VAxxxxxxx",
-            auth_token="auth_token",
-            account_sid="ACxxxxxxx",
-        )
+        config = TwilioConfig(**_TWILIO_KWARGS)
         assert config.enabled is True  # default
         assert config.verify_service_sid == "VAxxxxxxx"
         assert config.auth_token == "auth_token"
         assert config.account_sid == "ACxxxxxxx"
 
     def test_twilio_config_disabled(self):
-        config = TwilioConfig(
-            enabled=False,
-            verify_service_sid="VAxxxxxxx",
-            auth_token="auth_token",
-            account_sid="ACxxxxxxx",
-        )
+        config = TwilioConfig(enabled=False, **_TWILIO_KWARGS)
         assert config.enabled is False
 
     def test_twilio_config_without_authentication_type(self):
-        config = TwilioConfig(
-            verify_service_sid="VAxxxxxxx",
-            auth_token="auth_token",
-            account_sid="ACxxxxxxx",
-        )
+        config = TwilioConfig(**_TWILIO_KWARGS)
         assert config.authentication_type is None
 
     def test_twilio_config_with_authentication_type_sms(self):
-        config = TwilioConfig(
-            verify_service_sid="VAxxxxxxx",
-            auth_token="auth_token",
-            account_sid="ACxxxxxxx",
-            authentication_type="sms",
-        )
+        config = TwilioConfig(**_TWILIO_KWARGS, authentication_type="sms")
         assert config.authentication_type == TwilioAuthChannel.SMS
 
     def test_twilio_config_with_authentication_type_whatsapp(self):
-        config = TwilioConfig(
-            verify_service_sid="VAxxxxxxx",
-            auth_token="auth_token",
-            account_sid="ACxxxxxxx",
-            authentication_type="whatsapp",
-        )
+        config = TwilioConfig(**_TWILIO_KWARGS, authentication_type="whatsapp")
         assert config.authentication_type == TwilioAuthChannel.WHATSAPP
 
     def test_twilio_config_with_authentication_type_email(self):
-        config = TwilioConfig(
-            verify_service_sid="VAxxxxxxx",
-            auth_token="auth_token",
-            account_sid="ACxxxxxxx",
-            authentication_type="email",
-        )
+        config = TwilioConfig(**_TWILIO_KWARGS, authentication_type="email")
         assert config.authentication_type == TwilioAuthChannel.EMAIL
 
     def test_twilio_config_invalid_authentication_type(self):
         with pytest.raises(ValueError):
-            TwilioConfig(
-                verify_service_sid="VAxxxxxxx",
-                auth_token="auth_token",
-                account_sid="ACxxxxxxx",
-                authentication_type="telegram",
-            )
+            TwilioConfig(**_TWILIO_KWARGS, authentication_type="telegram")
 
     def test_telegram_config(self):
         config = TelegramConfig(token="bot_token")
@@ -309,11 +270,7 @@ class TestIntegrations:
     def test_create_integrations_with_configs(self):
         integrations = Integrations(
             telegram=TelegramConfig(token="bot_token"),
-            twilio=TwilioConfig(
-                verify_service_sid="VAxxxxxxx",
-                auth_token="auth_token",
-                account_sid="ACxxxxxxx",
-            ),
+            twilio=TwilioConfig(**_TWILIO_KWARGS),
         )
         assert integrations.telegram is not None
         assert integrations.twilio is not None
@@ -349,11 +306,39 @@ class TestIntegrations:
         assert integrations.whatsapp.enabled is False
         assert integrations.whatsapp.config.provider == "whapi"
 
+    def test_legacy_whapi_mapping_json(self):
+        payload = (
+            b'{"whapi": {"provider": "whapi",'
+            b' "api_url": "https://whapi.example.com/", "token": "token"}}'
+        )
+        integrations = Integrations.model_validate_json(payload)
+        assert integrations.whatsapp is not None
+        assert integrations.whatsapp.enabled is True
+        assert integrations.whatsapp.config.provider == "whapi"
+
+    def test_legacy_whapi_with_wrapper_format_json(self):
+        payload = (
+            b'{"whapi": {"enabled": false, "config": {"provider": "whapi",'
+            b' "api_url": "https://whapi.example.com/", "token": "token"}}}'
+        )
+        integrations = Integrations.model_validate_json(payload)
+        assert integrations.whatsapp is not None
+        assert integrations.whatsapp.enabled is False
+        assert integrations.whatsapp.config.provider == "whapi"
+
     def test_legacy_whapi_none_value(self):
         data = {"whapi": None}
         integrations = Integrations.model_validate(data)
         assert integrations.whatsapp is None
 
+    def test_legacy_whapi_compat_disabled(self, monkeypatch):
+        monkeypatch.setattr(
+            "chatbet_base_models.site_config_model.ENABLE_LEGACY_WHAPI_COMPAT", False
+        )
+        with pytest.raises(ValidationError):
+            Integrations.model_validate({"whapi": None})
+        assert Integrations.model_validate({}).whatsapp is None
+
 
 class TestIdentity:
     def test_create_identity(self):
@@ -564,22 +549,17 @@ class TestMeta:
         meta = Meta()
         assert meta.schema_version == "1.0.0"
         assert isinstance(meta.created_at, datetime)
+        assert meta.created_at.tzinfo is not None
 
     def test_create_meta_with_custom_values(self):
-        custom_time = datetime.now()
-        meta = Meta(schema_version="2.0.0", created_at=custom_time)
+        meta = Meta(schema_version="2.0.0", created_at=_FIXED_DT)
         assert meta.schema_version == "2.0.0"
-        assert meta.created_at == custom_time
+        assert meta.created_at == _FIXED_DT
 
 
 class TestSiteConfig:
-    def test_create_site_config(self):
-        identity = Identity(
-            site_name="Test Site",
-            company_id="test123",
-            site_url="https://test.example.com",
-        )
-        config = SiteConfig(identity=identity)
+    def test_create_site_config(self, base_identity):
+        config = SiteConfig(identity=base_identity)
 
         assert config.identity.site_name == "Test Site"
         # Check defaults are set
@@ -591,33 +571,31 @@ class TestSiteConfig:
         assert config.session.inactivity_threshold_minutes == 30
         assert config.integrations is not None
 
-    def test_default_factory(self):
-        config = SiteConfig.default_factory("Test Site", "test123")
+    def test_default_factory(self, default_site_config):
+        config = default_site_config
         assert config.identity.site_name == "Test Site"
         assert config.identity.company_id == "test123"
         assert str(config.identity.site_url) == "https://default.url/"
 
-    def test_site_config_with_custom_session(self):
-        identity = Identity(
-            site_name="Test Site",
-            company_id="test123",
-            site_url="https://test.example.com",
-        )
+    def test_sections_are_assignable(self):
+        config = SiteConfig.default_factory("Test Site", "test123")
+        config.features.odd_type = OddType.AMERICAN
+        config.locale.currency = "EUR"
+        assert config.features.odd_type == OddType.AMERICAN
+        assert config.locale.currency == "EUR"
+
+    def test_site_config_with_custom_session(self, base_identity):
         config = SiteConfig(
-            identity=identity, session=SessionConfig(inactivity_threshold_minutes=60)
+            identity=base_identity,
+            session=SessionConfig(inactivity_threshold_minutes=60),
         )
         assert config.session.inactivity_threshold_minutes == 60
 
 
 class TestSiteConfigDB:
-    def test_create_site_config_db(self):
-        identity = Identity(
-            site_name="Test Site",
-            company_id="test123",
-            site_url="https://test.example.com",
-        )
+    def test_create_site_config_db(self, base_identity):
         config_db = SiteConfigDB(
-            identity=identity, PK="company#test123", SK="site_config"
+            identity=base_identity, PK="company#test123", SK="site_config"
         )
 
         assert config_db.PK == "company#test123"
@@ -625,37 +603,38 @@ class TestSiteConfigDB:
         assert isinstance(config_db.created_at, datetime)
         assert isinstance(config_db.updated_at, datetime)
 
-    def test_default_factory(self):
-        config_db = SiteConfigDB.default_factory("Test Site", "test123")
+    def test_default_factory(self, default_site_config_db):
+        config_db = default_site_config_db
         assert config_db.PK == "company#test123"
         assert config_db.SK == "site_config"
         assert config_db.identity.site_name == "Test Site"
         assert config_db.identity.company_id == "test123"
 
-    def test_to_dynamodb_item(self):
-        config_db = SiteConfigDB.default_factory("Test Site", "test123")
-        item = config_db.to_dynamodb_item()
+    def test_default_factory_matches_site_config_defaults(
+        self, default_site_config, default_site_config_db
+    ):
+        db_fields = default_site_config_db.model_dump(
+            exclude={"PK", "SK", "created_at", "updated_at"}
+        )
+        assert db_fields == default_site_config.model_dump()
 
-        assert isinstance(item, dict)
-        assert "PK" in item
-        assert "SK" in item
-        assert "identity" in item
-        assert "locale" in item
-        assert "features" in item
-        assert "session" in item
+    @pytest.mark.parametrize(
+        "key",
+        ["PK", "SK", "identity", "locale", "features", "session", "integrations"],
+    )
+    def test_to_dynamodb_item_has_section(self, site_config_dynamo_item, key):
+        assert key in site_config_dynamo_item
 
-        # Check serialization
+    def test_to_dynamodb_item_serialization(self, site_config_dynamo_item):
+        item = site_config_dynamo_item
         assert isinstance(item["created_at"], str)  # datetime as ISO string
         assert isinstance(item["identity"]["site_url"], str)  # HttpUrl as string
         assert item["features"]["odd_type"] == "decimal"  # Enum as value
         assert item["locale"]["currency"] == "USD"
         assert item["session"]["inactivity_threshold_minutes"] == 30  # Default value
-
-        # Check nested structures
-        assert "integrations" in item
         assert "telegram" in item["integrations"]
         # Decimal is kept as Decimal object in DynamoDB serialization
-        # assert isinstance(item["limits"]["min_bet_amount"], str)  # Decimal as string
+        assert item["limits"]["min_bet_amount"] == Decimal("1.00")
 
     def test_to_dynamodb_item_with_authentication_type(self):
         config_db = SiteConfigDB.default_factory("Test Site", "test123")
@@ -664,11 +643,11 @@ class TestSiteConfigDB:
 
         assert item["integrations"]["twilio"]["authentication_type"] == "whatsapp"
 
-    def test_to_dynamodb_item_without_authentication_type(self):
-        config_db = SiteConfigDB.default_factory("Test Site", "test123")
-        item = config_db.to_dynamodb_item()
-
-        assert item["integrations"]["twilio"]["authentication_type"] is None
+    def test_to_dynamodb_item_without_authentication_type(
+        self, site_config_dynamo_item
+    ):
+        twilio = site_config_dynamo_item["integrations"]["twilio"]
+        assert twilio["authentication_type"] is None
 
 
 # ==========================="
@@ -760,16 +739,15 @@ class TestAuthConfig:
 class TestSiteConfigAuthBackwardCompat:
     """SiteConfig must default to OTP when no auth block is supplied."""
 
-    def test_site_config_without_auth_defaults_to_otp(self):
+    def test_site_config_without_auth_defaults_to_otp(self, base_identity):
         """4) SiteConfig(...without auth...) ⇒ site.auth.method == 'otp'."""
-        config = SiteConfig(identity=_identity_factory())
+        config = SiteConfig(identity=base_identity)
         assert config.auth is not None
         assert config.auth.method == "otp"
         assert config.auth.flow_id is None
 
-    def test_site_config_default_factory_keeps_otp_default(self):
-        config = SiteConfig.default_factory("Test Site", "test123")
-        assert config.auth.method == "otp"
+    def test_site_config_default_factory_keeps_otp_default(self, default_site_config):
+        assert default_site_config.auth.method == "otp"
 
 
 class TestSiteConfigAuthValidators:
@@ -576,6 +576,107 @@ class TestSportbookConfig:
         assert isinstance(item["config"]["url"], str)  # HttpUrl as string
         assert item["config"]["provider"] == "betsw3"
 
+    def test_from_minimal_validates_custom_tournaments(self):
+        sportbook = SportbookConfig.from_minimal_betsw3(
+            tournaments=[
+                {"sport_id": "basketball", "sport_name": "Basketball", "regions": []}
+            ]
+        )
+        assert isinstance(sportbook.tournaments[0], Tournament)
+        assert sportbook.tournaments[0].sport_id == "basketball"
+
+    def test_with_config(self):
+        sportbook = SportbookConfig.from_minimal_betsw3()
+        sportbook.updated_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        plannatech = PlannatechConfig(url="https://api.plannatech.com")
+
+        updated = sportbook.with_config(plannatech)
+
+        assert updated.config is plannatech
+        assert updated.tournaments == sportbook.tournaments
+        assert updated.updated_at > sportbook.updated_at
+        assert sportbook.config.provider == "betsw3"  # original untouched
+
+    def test_with_config_updates_sportbook_label(self):
+        sportbook = SportbookConfig.from_minimal_betsw3()
+        updated = sportbook.with_config(
+            PlannatechConfig(url="https://api.plannatech.com")
+        )
+
+        assert updated.sportbook == "Plannatech"
+        assert sportbook.sportbook == "Betsw3"
+
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            "from_minimal_betsw3",
+            "from_minimal_phoenix",
+            "from_minimal_kambi",
+            "from_minimal_plannatech",
+            "from_minimal_isolutions",
+            "from_minimal_betby",
+        ],
+    )
+    def test_with_config_label_matches_factory(self, factory):
+        sportbook = getattr(SportbookConfig, factory)()
+        assert sportbook.with_config(sportbook.config).sportbook == sportbook.sportbook
+
+    def test_with_config_copies_tournaments(self):
+        sportbook = SportbookConfig.from_minimal_betsw3()
+        updated = sportbook.with_config(
+            PlannatechConfig(url="https://api.plannatech.com")
+        )
+
+        assert updated.tournaments is not sportbook.tournaments
+        updated.tournaments.append(
+            Tournament(sport_id="tennis", sport_name="Tennis", regions=[])
+        )
+        updated.tournaments[0].regions.clear()
+        assert sportbook.tournaments[-1].sport_id != "tennis"
+        assert sportbook.tournaments[0].regions
+
+    def test_with_config_rejects_non_provider(self):
+        sportbook = SportbookConfig.from_minimal_betsw3()
+        with pytest.raises(TypeError, match="provider config instance"):
+            sportbook.with_config({"provider": "plannatech"})
+
+    def test_to_columnar(self):
+        tournaments = [
+            Tournament(
+                sport_id="soccer",
+                sport_name="Soccer",
+                regions=[
+                    Region(
+                        id="eu",
+                        competitions=[
+                            Competition(id="1", name="UCL", order=1),
+                            Competition(id="2", name="EPL", order=2),
+                        ],
+                    ),
+                    Region(id="sa", competitions=[Competition(id="3", name="Lib")]),
+                ],
+            ),
+            Tournament(sport_id="tennis", sport_name="Tennis", regions=[]),
+        ]
+        sportbook = SportbookConfig.from_minimal_betsw3(tournaments=tournaments)
+
+        columnar = sportbook.to_columnar()
+
+        assert columnar["sport_ids"] == ["soccer", "tennis"]
+        assert columnar["region_ranges"] == [[0, 2], [2, 2]]
+        assert columnar["regions"]["ids"] == ["eu", "sa"]
+        assert columnar["regions"]["competition_ranges"] == [[0, 2], [2, 3]]
+        assert columnar["competitions"]["ids"] == ["1", "2", "3"]
+        assert columnar["competitions"]["orders"] == [1, 2, 999_999]
+
+    def test_to_columnar_without_tournaments(self):
+        columnar = SportbookConfig(tournaments=None).to_columnar()
+
+        assert columnar["sport_ids"] == []
+        assert columnar["region_ranges"] == []
+        assert columnar["regions"]["ids"] == []
+        assert columnar["competitions"]["ids"] == []
+
 
 class TestSportbookConfigDB:
     def test_create_sportbook_config_db(self):
@@ -697,6 +798,20 @@ class TestSportbookConfigDB:
         assert item["config"]["language_id"] == 2
         assert isinstance(item["config"]["api_url"], str)
 
+    def test_from_dynamodb_item_round_trip(self):
+        sportbook_db = SportbookConfigDB.from_minimal_isolutions(
+            "test_company",
+            api_account="ChatBet",
+            events_program_code="mefvdituytybd",
+        )
+
+        loaded = SportbookConfigDB.from_dynamodb_item(sportbook_db.to_dynamodb_item())
+
+        assert isinstance(loaded, SportbookConfigDB)
+        assert loaded == sportbook_db
+        assert isinstance(loaded.tournaments[0], Tournament)
+        assert loaded.config.provider == "isolutions"
+
     def test_validation_requires_pk_sk(self):
         config = Betsw3Config(
             userId="user123",
@@ -712,6 +827,17 @@ class TestSportbookConfigDB:
         with pytest.raises(ValueError, match="PK and SK are required"):
             SportbookConfigDB(sportbook="Betsw3", config=config)
 
+    def test_with_config_keeps_keys(self):
+        sportbook_db = SportbookConfigDB.from_minimal_betsw3("test_company")
+        updated = sportbook_db.with_config(
+            PlannatechConfig(url="https://api.plannatech.com")
+        )
+
+        assert isinstance(updated, SportbookConfigDB)
+        assert updated.PK == "company#test_company"
+        assert updated.SK == "sportbook_config"
+        assert updated.config.provider == "plannatech"
+
 
 class TestSportsS3Reference:
     def test_create_sports_s3_reference(self):
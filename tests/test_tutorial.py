@@ -1,13 +1,19 @@
 import pytest
 from datetime import datetime, timezone
+from decimal import Decimal
+
+from pydantic import ValidationError
 
 from chatbet_base_models.tutorial import (
     TutorialItemDB,
     TutorialsDB,
+    TutorialsDBRead,
     TutorialVideo,
     GetTutorialVideosResponse,
     UploadTutorialVideoResponse,
     DeleteTutorialVideoResponse,
+    EMIT_EXAMPLES,
+    _schema_example,
 )
 
 
@@ -65,6 +71,55 @@ class TestTutorialItemDB:
         assert data["s3_key"] == "test/video.mp4"
         assert data["file_size"] == 1024000
 
+    def test_tutorial_item_db_is_mutable_and_ignores_extras(self):
+        """Test stored items with extra attributes load and can be edited"""
+        data = {
+            "tutorial_id": "test-123",
+            "s3_key": "test/video.mp4",
+            "title": "Test",
+            "file_name": "video.mp4",
+            "file_size": 1024000,
+            "file_type": "video/mp4",
+            "uploaded_at": "2026-01-05T12:00:00Z",
+        }
+        item = TutorialItemDB(**data, unknown="x")
+        assert "unknown" not in item.model_dump()
+        item.title = "Other"
+        assert item.title == "Other"
+
+        loaded = TutorialsDB.from_dynamodb_item(
+            {"PK": "company#c1", "SK": "tutorials", "tutorials": [{**data, "x": 1}]}
+        )
+        assert loaded.tutorials[0].tutorial_id == "test-123"
+
+    def test_tutorial_item_db_is_strict_except_file_size(self):
+        """Test strict str fields while file_size still accepts Decimal"""
+        data = {
+            "tutorial_id": "test-123",
+            "s3_key": "test/video.mp4",
+            "title": "Test",
+            "file_name": "video.mp4",
+            "file_size": Decimal("1024000"),
+            "file_type": "video/mp4",
+            "uploaded_at": "2026-01-05T12:00:00Z",
+        }
+        assert TutorialItemDB(**data).file_size == 1024000
+        with pytest.raises(ValidationError):
+            TutorialItemDB(**{**data, "tutorial_id": 123})
+
+    def test_tutorial_item_db_interns_file_type(self):
+        """Test equal file types share a single str object"""
+        base = {
+            "s3_key": "test/video.mp4",
+            "title": "Test",
+            "file_name": "video.mp4",
+            "file_size": 1024,
+            "uploaded_at": "2026-01-05T12:00:00Z",
+        }
+        a = TutorialItemDB(tutorial_id="a", file_type="".join(["video/", "mp4"]), **base)
+        b = TutorialItemDB(tutorial_id="b", file_type="".join(["video/", "mp4"]), **base)
+        assert a.file_type is b.file_type
+
 
 class TestTutorialsDB:
     """Test TutorialsDB model"""
@@ -160,6 +215,11 @@ class TestTutorialsDB:
         assert db_item.tutorials[1].title == "Tutorial 2"
         assert db_item.tutorials[2].title == "Tutorial 3"
 
+        removed = db_item.remove_tutorials(["abc-123", "ghi-789", "missing"])
+        assert removed == 2
+        assert [t.tutorial_id for t in db_item.tutorials] == ["def-456"]
+        assert db_item.updated_at > datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+
     def test_tutorials_db_from_dict(self):
         """Test creating TutorialsDB from dictionary"""
         data = {
@@ -215,10 +275,122 @@ class TestTutorialsDB:
         assert data["created_at"] == test_time
         assert isinstance(data["created_at"], datetime)
 
+    def test_tutorials_db_from_dynamodb_item_round_trip(self):
+        """Test loading a stored item rebuilds the same TutorialsDB"""
+        db_item = TutorialsDB.from_minimal("betvip")
+        db_item.add_tutorial(
+            s3_key="betvip/tutorials/como-apostar.mp4",
+            title="Cómo Apostar",
+            file_name="como-apostar.mp4",
+            file_size=15728640,
+            file_type="video/mp4",
+        )
+
+        loaded = TutorialsDB.from_dynamodb_item(db_item.to_dynamodb_item())
+
+        assert isinstance(loaded, TutorialsDB)
+        assert loaded == db_item
+        assert isinstance(loaded.tutorials[0], TutorialItemDB)
+
+
+class TestTutorialsDBRead:
+    """Test the read-only TutorialsDB variant"""
+
+    def test_from_dynamodb_item(self):
+        """Test loading a stored item into a frozen, tuple-backed config"""
+        db_item = TutorialsDB.from_minimal("betvip")
+        db_item.add_tutorial(
+            s3_key="betvip/tutorials/como-apostar.mp4",
+            title="Cómo Apostar",
+            file_name="como-apostar.mp4",
+            file_size=15728640,
+            file_type="video/mp4",
+        )
+        item = db_item.to_dynamodb_item()
+        item["tutorials"][0]["file_size"] = Decimal("15728640")  # as boto3 returns it
+
+        loaded = TutorialsDBRead.from_dynamodb_item(item)
+
+        assert isinstance(loaded.tutorials, tuple)
+        assert isinstance(loaded.tutorials[0], TutorialItemDB)
+        assert loaded.tutorials[0].file_size == 15728640
+        assert loaded.created_at == db_item.created_at
+        assert loaded.to_dynamodb_item() == db_item.to_dynamodb_item()
+
+    def test_parses_zulu_timestamps(self):
+        """Test timestamps ending in Z are parsed as UTC"""
+        loaded = TutorialsDBRead.from_dynamodb_item(
+            {
+                "PK": "company#betvip",
+                "SK": "tutorials",
+                "tutorials": [],
+                "created_at": "2026-01-05T14:30:00Z",
+                "updated_at": "2026-01-05T14:30:00Z",
+            }
+        )
+        assert loaded.created_at == datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+
+    def test_is_frozen(self):
+        """Test the read variant rejects assignment"""
+        loaded = TutorialsDBRead.from_dynamodb_item(
+            TutorialsDB.from_minimal("betvip").to_dynamodb_item()
+        )
+        with pytest.raises(ValidationError):
+            loaded.PK = "company#other"
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda c: c.touch(),
+            lambda c: c.add_tutorial(
+                s3_key="k",
+                title="T",
+                file_name="t.mp4",
+                file_size=1,
+                file_type="video/mp4",
+            ),
+            lambda c: c.remove_tutorial("abc-123-uuid"),
+            lambda c: c.remove_tutorials(["abc-123-uuid"]),
+        ],
+        ids=["touch", "add_tutorial", "remove_tutorial", "remove_tutorials"],
+    )
+    def test_mutators_raise_read_only(self, call):
+        """Test inherited mutating helpers fail with a clear error"""
+        db_item = TutorialsDB.from_minimal("betvip")
+        db_item.add_tutorial(
+            s3_key="betvip/tutorials/como-apostar.mp4",
+            title="Cómo Apostar",
+            file_name="como-apostar.mp4",
+            file_size=15728640,
+            file_type="video/mp4",
+            tutorial_id="abc-123-uuid",
+        )
+        loaded = TutorialsDBRead.from_dynamodb_item(db_item.to_dynamodb_item())
+
+        with pytest.raises(TypeError, match="TutorialsDBRead is read-only"):
+            call(loaded)
+        assert len(loaded.tutorials) == 1
+        assert loaded.updated_at == db_item.updated_at
+
 
 class TestTutorialVideo:
     """Test TutorialVideo model"""
 
+    def test_json_schema_example_follows_flag(self):
+        """Test the OpenAPI example is only emitted when enabled"""
+        schema = TutorialVideo.model_json_schema()
+        if EMIT_EXAMPLES:
+            assert schema["example"]["fileName"] == "como-apostar.mp4"
+        else:
+            assert "example" not in schema
+
+    def test_schema_example_helper(self, monkeypatch):
+        """Test _schema_example honours the flag"""
+        monkeypatch.setattr("chatbet_base_models.tutorial.EMIT_EXAMPLES", True)
+        assert _schema_example("TutorialVideo")["example"]["fileType"] == "video/mp4"
+        monkeypatch.setattr("chatbet_base_models.tutorial.EMIT_EXAMPLES", False)
+        assert _schema_example("TutorialVideo") is None
+
     def test_create_tutorial_video_with_all_fields(self):
         """Test creating tutorial video with all fields"""
         video = TutorialVideo(
@@ -310,6 +482,20 @@ class TestTutorialVideo:
 class TestGetTutorialVideosResponse:
     """Test GetTutorialVideosResponse model"""
 
+    def test_empty(self):
+        """Test empty() matches a validated empty response and is not shared"""
+        response = GetTutorialVideosResponse.empty()
+        assert response == GetTutorialVideosResponse(videos=[], count=0)
+        assert response.videos is not GetTutorialVideosResponse.empty().videos
+
+    def test_accepts_lax_input(self):
+        """Test API models keep coercing query/form style values"""
+        assert GetTutorialVideosResponse(videos=[], count="1").count == 1
+        response = DeleteTutorialVideoResponse(
+            success="true", message="Deleted", deleted_key="test/video.mp4"
+        )
+        assert response.success is True
+
     def test_create_response_with_videos(self):
         """Test creating response with tutorial videos"""
         videos = [
@@ -429,6 +615,39 @@ class TestUploadTutorialVideoResponse:
         assert response.success is False
         assert "failed" in response.message.lower()
 
+    def test_ok_builds_success_response(self):
+        """Test ok() builds a success response matching the validated one"""
+        fields = dict(
+            video_url="https://example.com/video.mp4",
+            video_key="test/video.mp4",
+            title="Test",
+            tutorial_id="test-123",
+        )
+        response = UploadTutorialVideoResponse.ok("Uploaded", **fields)
+
+        assert response == UploadTutorialVideoResponse(
+            success=True, message="Uploaded", **fields
+        )
+        assert set(response.model_dump(by_alias=True)) >= {
+            "videoUrl",
+            "videoKey",
+            "title",
+            "tutorialId",
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"tutorial_idd": "x"},
+            {"video_url": "u", "video_key": "k", "title": "t"},
+        ],
+        ids=["typo", "missing"],
+    )
+    def test_ok_rejects_unknown_or_missing_fields(self, kwargs):
+        """Test ok() only accepts the response's own fields, all required"""
+        with pytest.raises(TypeError):
+            UploadTutorialVideoResponse.ok("Uploaded", **kwargs)
+
     def test_upload_response_model_dump_uses_aliases(self):
         """Test that model_dump uses aliases"""
         response = UploadTutorialVideoResponse(
@@ -472,6 +691,22 @@ class TestDeleteTutorialVideoResponse:
         assert response.deleted_key == "test/video.mp4"
         assert response.deleted_tutorial_id is None
 
+    def test_ok_builds_success_response(self):
+        """Test ok() builds a success response matching the validated one"""
+        response = DeleteTutorialVideoResponse.ok(
+            "Video deleted", deleted_key="test/video.mp4"
+        )
+        expected = DeleteTutorialVideoResponse(
+            success=True, message="Video deleted", deleted_key="test/video.mp4"
+        )
+        assert response == expected
+        assert response.model_dump(by_alias=True)["deletedKey"] == "test/video.mp4"
+
+    def test_ok_rejects_unknown_fields(self):
+        """Test ok() does not silently accept misspelled fields"""
+        with pytest.raises(TypeError):
+            DeleteTutorialVideoResponse.ok("Video deleted", deleted_kye="x")
+
     def test_delete_response_with_camelcase_aliases(self):
         """Test creating delete response with camelCase field names"""
         response = DeleteTutorialVideoResponse(